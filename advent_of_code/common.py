@@ -1,14 +1,24 @@
 """ Вспомогательные утилиты """
 
+import re
 from enum import unique, Enum
 from itertools import starmap
 from pathlib import Path
-from typing import TypeVar
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, Tuple, Type, TypeVar, TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from typing_extensions import dataclass_transform
+else:
+    def dataclass_transform(**_):
+        """ Маркер для статических анализаторов (во время выполнения ничего не делает) """
+        return lambda func: func
 
 
 ChunkedElem = TypeVar('ChunkedElem')
 FirstElem = TypeVar('FirstElem')
 LastElem = TypeVar('LastElem')
+ParsedElem = TypeVar('ParsedElem')
+RecordType = TypeVar('RecordType')
 TakeElem = TypeVar('TakeElem')
 WindowedElem = TypeVar('WindowedElem')
 
@@ -27,3 +37,168 @@ class Task(Enum):
 def zip_with(func, *args):
     """ Применение функции func для кортежа элементов из разных источников """
     return starmap(func, zip(*args))
+
+
+def _record_source(fields: Tuple[str, ...], defaults: Dict[str, Any]) -> str:
+    """ Исходный код конструктора, сравнения и хеширования записи с заданными полями """
+
+    params = ', '.join(f'{name}=_default_{name}' if name in defaults else name for name in fields)
+    args = ''.join(f'{name}, ' for name in fields)
+    values = ''.join(f'self.{name}, ' for name in fields)
+    other_values = ''.join(f'other.{name}, ' for name in fields)
+    body = ''.join(f'    _set_{name}(self, {name})\n' for name in fields)
+    return (
+        f'def __init__(self, {params}):\n{body}    _set__hash(self, hash(({args})))\n'
+        f'def __eq__(self, other):\n'
+        f'    if other.__class__ is self.__class__:\n'
+        f'        return ({values}) == ({other_values})\n'
+        f'    return NotImplemented\n'
+        f'def __hash__(self):\n    return self._hash\n'
+        f'def _astuple(self):\n    return ({values})\n'
+    )
+
+
+@dataclass_transform()
+def record(cls: Type[RecordType]) -> Type[RecordType]:
+    """ Компактная неизменяемая запись на основе класса с аннотациями полей
+
+    Замена dataclass(frozen=True) для объектов, которые создаются в горячих циклах:
+      * поля хранятся в __slots__, у экземпляров нет __dict__;
+      * конструктор заполняет слоты напрямую через их дескрипторы, минуя object.__setattr__;
+      * хеш вычисляется в конструкторе и хранится в слоте экземпляра.
+
+    Методы и свойства исходного класса сохраняются, значения по умолчанию поддерживаются.
+    Подклассы записи должны объявлять __slots__ (как правило, пустой), иначе возникает TypeError.
+    """
+
+    fields = tuple(cls.__dict__.get('__annotations__', {}))
+    defaults = {name: cls.__dict__[name] for name in fields if name in cls.__dict__}
+
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in fields and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = fields + ('_hash',)
+    namespace['__match_args__'] = fields
+    namespace['_fields'] = fields
+    # Метакласс сохраняется (например, ABCMeta для абстрактных записей)
+    new_cls: Type[RecordType] = cast(Any, type(cls))(cls.__name__, cls.__bases__, namespace)
+
+    # Слоты заполняются через дескрипторы, поэтому запрет __setattr__ не мешает конструктору.
+    # Хеш вычисляется сразу: экземпляры записей чаще всего попадают в множества и словари
+    scope: Dict[str, Any] = {f'_set_{name}': getattr(new_cls, name).__set__ for name in fields}
+    scope.update({f'_default_{name}': value for name, value in defaults.items()})
+    scope['_set__hash'] = getattr(new_cls, '_hash').__set__
+
+    exec(_record_source(fields, defaults), scope)  # pylint: disable=exec-used
+
+    astuple = scope['_astuple']
+
+    def __repr__(self):
+        return f'{self.__class__.__qualname__}(' + ', '.join(
+            f'{name}={getattr(self, name)!r}' for name in fields
+        ) + ')'
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'cannot assign to field {name!r}')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'cannot delete field {name!r}')
+
+    def __reduce__(self):
+        return self.__class__, astuple(self)
+
+    def __init_subclass__(subclass, **kwargs):
+        # Без собственного __slots__ у экземпляров подкласса снова появился бы __dict__
+        if '__slots__' not in subclass.__dict__:
+            raise TypeError(f'{subclass.__qualname__} must declare __slots__ (subclass of record {cls.__qualname__})')
+        super(new_cls, subclass).__init_subclass__(**kwargs)
+
+    methods = {
+        '__init__': scope['__init__'],
+        '__eq__': scope['__eq__'],
+        '__hash__': scope['__hash__'],
+        '__setattr__': __setattr__,
+        '__delattr__': __delattr__,
+        '__reduce__': __reduce__,
+        '__init_subclass__': __init_subclass__,
+    }
+    if '__repr__' not in namespace:
+        methods['__repr__'] = __repr__
+
+    for name, method in methods.items():
+        method.__qualname__ = f'{new_cls.__qualname__}.{name}'
+        type.__setattr__(new_cls, name, classmethod(method) if name == '__init_subclass__' else method)
+
+    return new_cls
+
+
+class ParseSpec(Generic[ParsedElem]):
+    """ Декларативное описание разбора строк входных данных
+
+    Каждое правило состоит из отличающих его слов (токенов), шаблона и функции построения результата.
+    Шаблоны компилируются один раз при создании спецификации (как правило, на уровне модуля).
+    Для одной строки правило выбирается по словарю: первое слово строки, совпадающее с токеном
+    одного из правил, определяет единственный шаблон, с которым сравнивается строка. Токен не обязан
+    быть первым словом строки: например, для команд "x AND y -> z" и "123 -> x" токенами служат AND и ->.
+    Буфер целиком разбирается за один проход finditer по объединенному выражению, сработавшее
+    правило определяется по номеру внешней группы совпадения.
+    """
+
+    def __init__(
+            self,
+            *rules: Tuple[Iterable[str], str, Callable[..., ParsedElem]],
+            error: str = 'Wrong line',
+    ) -> None:
+        self._error = error
+        self._rules: Dict[str, Tuple['re.Pattern[str]', Callable[..., ParsedElem]]] = {}
+        self._builders: Dict[int, Tuple[int, int, Callable[..., ParsedElem]]] = {}
+
+        branches = []
+        group = 1
+        for tokens, pattern, builder in rules:
+            regex = re.compile(rf'{pattern}[ \t]*\r?\n?')
+            for token in tokens:
+                if token in self._rules:
+                    raise ValueError(f'Duplicate token: {token}')
+                self._rules[token] = (regex, builder)
+
+            self._builders[group] = (group, group + regex.groups, builder)
+            branches.append(f'({pattern})')
+            group += regex.groups + 1
+
+        # Совпадение занимает строку целиком вместе с переводом строки, поэтому совпадения
+        # корректного буфера примыкают друг к другу (между ними допустимы только пустые строки)
+        self._buffer_regex = re.compile(rf'^(?:{"|".join(branches)})[ \t]*\r?(?:\n|\Z)', re.MULTILINE)
+
+    def parse(self, line: str) -> ParsedElem:
+        """ Возвращает результат разбора одной строки """
+
+        for word in line.split():
+            if (rule := self._rules.get(word)) is not None:
+                regex, builder = rule
+                if (match := regex.fullmatch(line)) is not None:
+                    return builder(*match.groups())
+                break
+
+        raise ValueError(f'{self._error}: {line}')
+
+    def parse_all(self, buffer: str) -> Iterator[ParsedElem]:
+        """ Возвращает результаты разбора всех непустых строк буфера (для неподходящей строки - ValueError) """
+
+        position = 0
+        for match in self._buffer_regex.finditer(buffer):
+            self._check_gap(buffer, position, match.start())
+            start, stop, builder = self._builders[match.lastindex or 0]
+            yield builder(*match.groups()[start:stop])
+            position = match.end()
+
+        self._check_gap(buffer, position, len(buffer))
+
+    def _check_gap(self, buffer: str, start: int, stop: int) -> None:
+        """ Проверяет, что между совпадениями остались только пустые строки """
+
+        if start != stop and not buffer[start:stop].isspace():
+            line = next(line for line in buffer[start:stop].splitlines() if line.strip())
+            raise ValueError(f'{self._error}: {line}')
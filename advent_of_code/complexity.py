@@ -0,0 +1,335 @@
+""" Эмпирическая оценка сложности решений на сгенерированных входных данных
+
+Каждое решение запускается на входных данных геометрически растущего размера
+(по умолчанию 10^3 ... 10^7), после чего методом наименьших квадратов в логарифмическом
+масштабе подбирается показатель степени роста времени выполнения. Решения, у которых
+показатель заметно больше единицы, хотя линейный алгоритм возможен, попадают в отчет
+с отметкой SUPERLINEAR. Как только один запуск превышает бюджет времени, более крупные
+размеры для этого решения пропускаются.
+
+Пример запуска :
+
+    python -m advent_of_code.complexity 7 2.0
+"""
+
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+from advent_of_code.common import Task
+from advent_of_code.runner import load_module, solve, solver
+
+
+# Показатель степени, начиная с которого рост считается сверхлинейным
+SUPERLINEAR_THRESHOLD = 1.25
+
+# Генератор входных данных заданного размера
+Generator = Callable[[random.Random, int], List[str]]
+
+# Вызов решения с нестандартной сигнатурой: функция решения и сгенерированные строки
+Invoker = Callable[[Callable[..., Any], List[str]], Any]
+
+
+@dataclass(frozen=True)
+class Case:
+    """ Решение и способ генерации входных данных для него """
+    year: int
+    day: int
+    task: Task
+    generate: Generator
+    linear_achievable: bool = True
+    invoke: Optional[Invoker] = None
+
+    @property
+    def name(self) -> str:
+        """ Возвращает идентификатор решения """
+        return f'y{self.year}/d{self.day:02d}.{self.task.name}_task'
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """ Результат замеров времени выполнения решения """
+    case: Case
+    points: Tuple[Tuple[int, float], ...]
+
+    @property
+    def exponent(self) -> float:
+        """ Возвращает показатель степени роста времени выполнения """
+        return fit_exponent(self.points)
+
+    @property
+    def superlinear(self) -> bool:
+        """ Возвращает True если рост сверхлинейный, хотя линейный алгоритм возможен """
+        return self.case.linear_achievable and self.exponent > SUPERLINEAR_THRESHOLD
+
+
+def fit_exponent(points: Sequence[Tuple[int, float]]) -> float:
+    """ Возвращает наклон прямой log(время) = k * log(размер) + b по методу наименьших квадратов """
+
+    logs = [(math.log(size), math.log(max(elapsed, 1e-9))) for size, elapsed in points]
+    if len(logs) < 2:
+        return float('nan')
+
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in logs)
+    denominator = sum((x - mean_x) ** 2 for x, _ in logs)
+
+    # Все замеры выполнены на одном размере: наклон не определен
+    if not denominator:
+        return float('nan')
+
+    return numerator / denominator
+
+
+def _floors(_: random.Random, size: int) -> List[str]:
+    # Этаж опускается ниже нуля не раньше последнего символа (при четном размере - никогда),
+    # поэтому обрабатывается вся строка
+    half = size // 2
+    return ['(' * half + ')' * (size - half)]
+
+
+def _boxes(rnd: random.Random, size: int) -> List[str]:
+    return [f'{rnd.randint(1, 30)}x{rnd.randint(1, 30)}x{rnd.randint(1, 30)}\n' for _ in range(size)]
+
+
+def _houses(rnd: random.Random, size: int) -> List[str]:
+    return [''.join(rnd.choice('^>v<') for _ in range(size))]
+
+
+def _words(rnd: random.Random, size: int) -> List[str]:
+    return [''.join(rnd.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(16)) + '\n' for _ in range(size)]
+
+
+def _spiral(_: random.Random, size: int) -> List[str]:
+    # Раскручивающаяся спираль никогда не пересекает собственный путь
+    return [', '.join(f'R{index}' for index in range(1, size + 1))]
+
+
+def _captcha(rnd: random.Random, size: int) -> List[str]:
+    return [''.join(rnd.choice('0123456789') for _ in range(size))]
+
+
+def _offsets(_: random.Random, size: int) -> List[str]:
+    return ['0\n'] * size
+
+
+def _course(rnd: random.Random, size: int) -> List[str]:
+    return [f'{rnd.choice(("forward", "down", "up"))} {rnd.randint(1, 9)}\n' for _ in range(size)]
+
+
+def _diagnostics(rnd: random.Random, size: int) -> List[str]:
+    width = size.bit_length() + 1
+    return [f'{value:0{width}b}\n' for value in rnd.sample(range(1 << width), size)]
+
+
+def _vents(rnd: random.Random, size: int) -> List[str]:
+    result = []
+    for _ in range(size):
+        x, y, length = rnd.randint(0, 1000), rnd.randint(0, 1000), rnd.randint(1, 10)
+        result.append(f'{x},{y} -> {x + length},{y}\n' if rnd.random() < 0.5 else f'{x},{y} -> {x},{y + length}\n')
+    return result
+
+
+def _crabs(rnd: random.Random, size: int) -> List[str]:
+    return [','.join(str(rnd.randrange(size)) for _ in range(size))]
+
+
+def _light_commands(rnd: random.Random, size: int) -> List[str]:
+    result = []
+    for _ in range(size):
+        left, top = rnd.randrange(1000), rnd.randrange(1000)
+        right, bottom = rnd.randrange(left, 1000), rnd.randrange(top, 1000)
+        action = rnd.choice(('turn on', 'turn off', 'toggle'))
+        result.append(f'{action} {left},{top} through {right},{bottom}\n')
+    return result
+
+
+def _circuit(rnd: random.Random, size: int) -> List[str]:
+    # Проводники образуют сбалансированное дерево с корнем a, поэтому глубина зависимостей - log(size)
+    def wire(index: int) -> str:
+        return ('a', 'b')[index] if index < 2 else f'w{index}'
+
+    result = []
+    for index in range(size):
+        left, right = 2 * index + 1, 2 * index + 2
+        if right < size:
+            result.append(f'{wire(left)} {rnd.choice(("AND", "OR"))} {wire(right)} -> {wire(index)}\n')
+        elif left < size:
+            result.append(f'NOT {wire(left)} -> {wire(index)}\n')
+        else:
+            result.append(f'{rnd.randrange(1 << 16)} -> {wire(index)}\n')
+    rnd.shuffle(result)
+    return result
+
+
+def _escaped(rnd: random.Random, size: int) -> List[str]:
+    chunks = ('a', 'bc', '\\\\', '\\"', '\\x4f')
+    return ['"' + ''.join(rnd.choices(chunks, k=8)) + '"\n' for _ in range(size)]
+
+
+def _keypad(rnd: random.Random, size: int) -> List[str]:
+    return [''.join(rnd.choices('UDLR', k=max(size // 5, 1))) for _ in range(5)]
+
+
+def _spreadsheet(rnd: random.Random, size: int) -> List[str]:
+    result = []
+    for _ in range(size):
+        # В каждой строке ровно одна пара чисел, одно из которых делится на другое
+        divisor = rnd.randint(2, 9)
+        row = [divisor, divisor * rnd.randint(2, 9)] + [rnd.choice((1009, 1013, 1019, 1021)) for _ in range(2)]
+        rnd.shuffle(row)
+        result.append('\t'.join(map(str, row)) + '\n')
+    return result
+
+
+def _square(_: random.Random, size: int) -> List[str]:
+    return [str(size)]
+
+
+def _passphrases(rnd: random.Random, size: int) -> List[str]:
+    def word() -> str:
+        return ''.join(rnd.choices('abcdefghijklmnopqrstuvwxyz', k=rnd.randint(2, 6)))
+
+    return [' '.join(word() for _ in range(6)) + '\n' for _ in range(size)]
+
+
+def _depths(rnd: random.Random, size: int) -> List[str]:
+    return [f'{rnd.randint(100, 9999)}\n' for _ in range(size)]
+
+
+def _bingo(rnd: random.Random, size: int) -> List[str]:
+    numbers = list(range(100))
+    rnd.shuffle(numbers)
+    result = [','.join(map(str, numbers)) + '\n']
+    for _ in range(size):
+        board = rnd.sample(range(100), 25)
+        result.append('\n')
+        result.extend(' '.join(f'{value:>2}' for value in board[row:row + 5]) + '\n' for row in range(0, 25, 5))
+    return result
+
+
+def _fish(rnd: random.Random, size: int) -> List[str]:
+    return [','.join(str(rnd.randint(1, 5)) for _ in range(size))]
+
+
+def _calories(rnd: random.Random, size: int) -> List[str]:
+    result: List[str] = []
+    for _ in range(size):
+        result.extend(f'{rnd.randint(1000, 9999)}\n' for _ in range(rnd.randint(1, 5)))
+        result.append('\n')
+    return result
+
+
+CASES: Tuple[Case, ...] = (
+    Case(2015, 1, Task.first, _floors),
+    Case(2015, 1, Task.second, _floors),
+    Case(2015, 2, Task.first, _boxes),
+    Case(2015, 2, Task.second, _boxes),
+    Case(2015, 3, Task.first, _houses),
+    Case(2015, 3, Task.second, _houses),
+    Case(2015, 5, Task.first, _words),
+    Case(2015, 5, Task.second, _words),
+    Case(2015, 6, Task.first, _light_commands),
+    Case(2015, 6, Task.second, _light_commands),
+    Case(2015, 7, Task.first, _circuit),
+    Case(2015, 7, Task.second, _circuit),
+    Case(2015, 8, Task.first, _escaped),
+    Case(2015, 8, Task.second, _escaped),
+    Case(2016, 1, Task.first, _spiral),
+    Case(2016, 1, Task.second, _spiral),
+    Case(2016, 2, Task.first, _keypad),
+    Case(2017, 1, Task.first, _captcha),
+    Case(2017, 1, Task.second, _captcha),
+    Case(2017, 2, Task.first, _spreadsheet),
+    Case(2017, 2, Task.second, _spreadsheet),
+    Case(2017, 3, Task.first, _square, invoke=lambda func, strings: func(int(strings[0]))),
+    Case(2017, 3, Task.second, _square, invoke=lambda func, strings: func(int(strings[0]))),
+    Case(2017, 4, Task.first, _passphrases),
+    Case(2017, 4, Task.second, _passphrases),
+    Case(2017, 5, Task.first, _offsets),
+    Case(2017, 5, Task.second, _offsets),
+    Case(2021, 1, Task.first, _depths),
+    Case(2021, 1, Task.second, _depths),
+    Case(2021, 2, Task.first, _course),
+    Case(2021, 2, Task.second, _course),
+    Case(2021, 3, Task.first, _diagnostics),
+    Case(2021, 3, Task.second, _diagnostics),
+    Case(2021, 4, Task.first, _bingo),
+    Case(2021, 4, Task.second, _bingo),
+    Case(2021, 5, Task.first, _vents),
+    Case(2021, 5, Task.second, _vents),
+    Case(2021, 6, Task.first, _fish, invoke=lambda func, strings: func(80, strings)),
+    Case(2021, 6, Task.second, _fish, invoke=lambda func, strings: func(256, strings)),
+    Case(2021, 7, Task.first, _crabs),
+    Case(2021, 7, Task.second, _crabs),
+    Case(2022, 1, Task.first, _calories),
+    Case(2022, 1, Task.second, _calories),
+)
+
+
+def geometric_sizes(min_exponent: int = 3, max_exponent: int = 7, base: int = 10) -> List[int]:
+    """ Возвращает геометрическую последовательность размеров входных данных """
+    return [base ** exponent for exponent in range(min_exponent, max_exponent + 1)]
+
+
+def measure(case: Case, sizes: Iterable[int], budget: float = 2.0, seed: int = 0) -> Measurement:
+    """ Замеряет время выполнения решения для каждого размера входных данных
+
+    :param case:    Решение и генератор входных данных
+    :param sizes:   Размеры входных данных (по возрастанию)
+    :param budget:  Бюджет времени одного запуска в секундах; после его превышения замеры прекращаются
+    :param seed:    Начальное значение генератора случайных чисел
+    :return:        Результат замеров
+    """
+
+    # Импорт модуля решения (и numpy) не должен попасть в замер первого размера
+    module = load_module(case.year, case.day)
+
+    rnd = random.Random(seed)
+    points = []
+    for size in sizes:
+        strings = case.generate(rnd, size)
+        started = time.perf_counter()
+        if case.invoke is None:
+            solve(case.year, case.day, case.task, iter(strings))
+        else:
+            case.invoke(solver(module, case.task), strings)
+        elapsed = time.perf_counter() - started
+        points.append((size, elapsed))
+        if elapsed > budget:
+            break
+
+    return Measurement(case=case, points=tuple(points))
+
+
+def report(measurements: Iterable[Measurement]) -> str:
+    """ Возвращает отчет, упорядоченный по убыванию показателя степени роста (неопределенные - в конце) """
+
+    def order(item: Measurement) -> Tuple[bool, float]:
+        exponent = item.exponent
+        return (True, 0.0) if math.isnan(exponent) else (False, -exponent)
+
+    rows = []
+    for item in sorted(measurements, key=order):
+        timings = ' '.join(f'{size:.0e}:{elapsed:.3f}s' for size, elapsed in item.points)
+        flag = 'SUPERLINEAR' if item.superlinear else ''
+        rows.append(f'{item.case.name:<28} n^{item.exponent:<5.2f} {flag:<11} {timings}')
+
+    return '\n'.join(rows)
+
+
+def main(argv: List[str]) -> None:
+    """ Запуск оценки сложности из командной строки """
+
+    max_exponent = int(argv[0]) if argv else 7
+    budget = float(argv[1]) if len(argv) > 1 else 2.0
+    sizes = geometric_sizes(max_exponent=max_exponent)
+
+    print(report(measure(case, sizes, budget) for case in CASES))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,8 +1,9 @@
 """ Общие фикстуры """
 
+import tracemalloc
 from functools import partial
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Callable, Iterable, Iterator
 import pytest
 from advent_of_code.common import Task, DATA_DIR
 
@@ -70,6 +71,33 @@ def y2022_file_loader():
     return partial(_file_loader, DATA_DIR / 'y2022')
 
 
+def _run_with_bounded_memory(solver: Callable[..., Any], strings: Iterable[str], limit: int, *args: Any) -> Any:
+    """ Запускает решение на однопроходном потоке строк и проверяет пиковый объем выделенной памяти
+
+    :param solver:  Функция решения задачи
+    :param strings: Входной набор данных (как правило, генератор)
+    :param limit:   Допустимый пиковый объем памяти в байтах
+    :return:        Ответ на задачу
+    """
+
+    stream = (string for string in strings)
+    tracemalloc.start()
+    try:
+        result = solver(stream, *args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak <= limit, f'peak memory {peak} bytes exceeds {limit} bytes'
+    return result
+
+
+@pytest.fixture()
+def bounded_memory():
+    """ Возвращает функцию запуска решения в режиме потоковой обработки с ограничением памяти """
+    return _run_with_bounded_memory
+
+
 def pytest_configure(config):
     """ Добавление пользовательских маркеров для тестов """
 
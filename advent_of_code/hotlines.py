@@ -0,0 +1,210 @@
+""" Построчный подсчет исполнения кода решения через sys.monitoring (Python 3.12+)
+
+Инструментирование ограничено одним выбранным модулем: события LINE и BRANCH включаются
+только для объектов кода этого модуля (включая вложенные функции и лямбды), поэтому
+остальной код выполняется без накладных расходов.
+
+Пример запуска :
+
+    python -m advent_of_code.hotlines y2017.d05 first_task advent_of_code/data/y2017/d05.1
+"""
+
+import dis
+import gc
+import importlib
+import sys
+import typing
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType, FunctionType, ModuleType
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Tuple, TypeVar
+
+
+Result = TypeVar('Result')
+
+# Идентификатор инструмента для sys.monitoring (диапазон 0..5, 2 = PROFILER_ID)
+TOOL_ID = 2
+TOOL_NAME = 'advent_of_code.hotlines'
+
+# Ключ ветвления: номер строки и смещение инструкции перехода
+BranchKey = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class BranchStats:
+    """ Статистика по одной инструкции условного перехода """
+    taken: int
+    not_taken: int
+
+    @property
+    def total(self) -> int:
+        """ Возвращает общее количество срабатываний перехода """
+        return self.taken + self.not_taken
+
+    @property
+    def taken_ratio(self) -> float:
+        """ Возвращает долю срабатываний, в которых переход был выполнен """
+        return self.taken / self.total if self.total else 0.0
+
+
+@dataclass(frozen=True)
+class Report:
+    """ Результат инструментирования модуля """
+
+    module: ModuleType
+    lines: Dict[int, int] = field(default_factory=dict)
+    branches: Dict[BranchKey, BranchStats] = field(default_factory=dict)
+
+    def hottest(self, limit: int = 10) -> List[Tuple[int, int]]:
+        """ Возвращает самые часто исполняемые строки в виде пар (номер строки, количество) """
+        return Counter(self.lines).most_common(limit)
+
+    def format(self, limit: int = 10) -> str:
+        """ Возвращает текстовое представление отчета """
+
+        file_name = getattr(self.module, '__file__', None)
+        source = Path(file_name).read_text(encoding='utf-8').splitlines() if file_name else []
+        branches_by_line: DefaultDict[int, List[BranchStats]] = defaultdict(list)
+        for (line, _), stats in sorted(self.branches.items()):
+            branches_by_line[line].append(stats)
+
+        result = []
+        for line, count in self.hottest(limit):
+            text = source[line - 1].strip() if 0 < line <= len(source) else ''
+            ratios = ', '.join(f'{stats.taken_ratio:.1%}' for stats in branches_by_line.get(line, []))
+            result.append(f'{line:>5} {count:>12}  {text}' + (f'  [taken: {ratios}]' if ratios else ''))
+
+        return '\n'.join(result)
+
+
+def _code_objects(module: ModuleType) -> Iterator[CodeType]:
+    """ Возвращает все объекты кода, определенные в модуле (включая вложенные)
+
+    Функции ищутся среди всех объектов сборщика мусора по имени файла их кода, поэтому находятся
+    и функции под декораторами, и лямбды, сохраненные в контейнерах или атрибутах объектов модуля.
+    """
+
+    def walk(code: CodeType) -> Iterator[CodeType]:
+        yield code
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                yield from walk(const)
+
+    file_name = getattr(module, '__file__', None)
+    if file_name is None:
+        return
+
+    seen = set()
+    for value in gc.get_objects():
+        if not isinstance(value, FunctionType) or value.__code__.co_filename != file_name:
+            continue
+        for code in walk(value.__code__):
+            if code not in seen:
+                seen.add(code)
+                yield code
+
+
+def _fallthrough_offsets(code: CodeType) -> Dict[int, int]:
+    """ Возвращает смещение следующей инструкции для каждой инструкции объекта кода """
+    instructions = list(dis.get_instructions(code))
+    return {
+        current.offset: following.offset
+        for current, following in zip(instructions, instructions[1:])
+    }
+
+
+def _line_of(code: CodeType, offset: int) -> int:
+    """ Возвращает номер строки исходного кода для смещения инструкции """
+
+    line = code.co_firstlineno
+    for start, _, lineno in code.co_lines():
+        if start > offset:
+            break
+        if lineno is not None:
+            line = lineno
+
+    return line
+
+
+def _branch_stats(branches: Dict[Tuple[CodeType, int], typing.Counter[int]]) -> Dict[BranchKey, BranchStats]:
+    """ Возвращает статистику переходов по строкам исходя из счетчиков переходов по смещениям назначения """
+
+    result: Dict[BranchKey, BranchStats] = {}
+    fallthrough: Dict[CodeType, Dict[int, int]] = {}
+    for (code, offset), destinations in branches.items():
+        if code not in fallthrough:
+            fallthrough[code] = _fallthrough_offsets(code)
+        next_offset = fallthrough[code].get(offset)
+        not_taken = destinations.get(next_offset, 0) if next_offset is not None else 0
+        result[(_line_of(code, offset), offset)] = BranchStats(
+            taken=sum(destinations.values()) - not_taken,
+            not_taken=not_taken,
+        )
+
+    return result
+
+
+def profile(
+        module: ModuleType,
+        func: Callable[..., Result],
+        *args: Any,
+        **kwargs: Any,
+) -> Tuple[Result, Report]:
+    """ Выполняет функцию, собирая построчную статистику исполнения кода указанного модуля
+
+    :param module:  Модуль, код которого инструментируется
+    :param func:    Вызываемая функция (как правило, решение задачи)
+    :return:        Результат вызова и отчет со статистикой
+    """
+
+    if sys.version_info < (3, 12):
+        raise RuntimeError('sys.monitoring requires Python 3.12+')
+
+    monitoring = getattr(sys, 'monitoring')
+    events = monitoring.events
+
+    lines: typing.Counter[int] = Counter()
+    branches: DefaultDict[Tuple[CodeType, int], typing.Counter[int]] = defaultdict(Counter)
+
+    def on_line(_code: CodeType, line_number: int) -> None:
+        lines[line_number] += 1
+
+    def on_branch(code: CodeType, instruction_offset: int, destination_offset: int) -> None:
+        branches[(code, instruction_offset)][destination_offset] += 1
+
+    codes = list(_code_objects(module))
+
+    monitoring.use_tool_id(TOOL_ID, TOOL_NAME)
+    try:
+        monitoring.register_callback(TOOL_ID, events.LINE, on_line)
+        monitoring.register_callback(TOOL_ID, events.BRANCH, on_branch)
+        for code in codes:
+            monitoring.set_local_events(TOOL_ID, code, events.LINE | events.BRANCH)
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            for code in codes:
+                monitoring.set_local_events(TOOL_ID, code, events.NO_EVENTS)
+            monitoring.register_callback(TOOL_ID, events.LINE, None)
+            monitoring.register_callback(TOOL_ID, events.BRANCH, None)
+    finally:
+        monitoring.free_tool_id(TOOL_ID)
+
+    return result, Report(module=module, lines=dict(lines), branches=_branch_stats(branches))
+
+
+def main(argv: List[str]) -> None:
+    """ Запуск инструментирования из командной строки """
+
+    problem, task_name, data_file = argv
+    module = importlib.import_module(f'advent_of_code.problems.{problem}')
+    with open(data_file, 'r', encoding='utf-8') as file:
+        result, report = profile(module, getattr(module, task_name), file)
+
+    print(f'result: {result}')
+    print(report.format())
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
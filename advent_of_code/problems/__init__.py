@@ -0,0 +1,13 @@
+""" Решения задач Advent of Code
+
+Контракт потоковой обработки входных данных :
+  * решение получает входной набор данных как однопроходный итератор строк и читает его ровно один раз;
+  * входной набор целиком не материализуется (list(...), tuple(...)), если того не требует сама задача;
+  * объем памяти растет только вместе с состоянием, необходимым для ответа (счетчики, сетка, граф),
+    а не с размером входного набора;
+  * если задаче нужна вся последовательность (например, y2017/d01.second_task), она хранится
+    в компактном виде (bytearray, array).
+
+Соблюдение контракта проверяется фикстурой bounded_memory (см. conftest.py): решение запускается
+на генераторе строк, а пиковый объем выделенной памяти измеряется через tracemalloc.
+"""
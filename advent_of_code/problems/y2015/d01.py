@@ -43,7 +43,22 @@ What is the position of the character that causes Santa to first enter the basem
 """
 
 import itertools
-from typing import Iterable
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple, Union, cast
+import numpy as np
+import numpy.typing as npt
+
+
+# Коды инструкций в сыром буфере
+UP, DOWN = ord('('), ord(')')
+
+# Количество инструкций, обрабатываемых за один шаг поиска подвала
+# (ограничивает расход памяти и гарантирует, что накопленная сумма блока помещается в int32)
+BLOCK_SIZE = 1 << 22
 
 
 def _up_or_down(direction: str) -> int:
@@ -77,3 +92,232 @@ def second_task(instructions: Iterable[str]) -> int:
             return index
 
     return 0
+
+
+def final_floor(buffer: bytes) -> int:
+    """ Решение первой задачи для сырого буфера инструкций """
+    return buffer.count(b'(') - buffer.count(b')')
+
+
+def _floors(instructions: npt.NDArray[np.uint8]) -> Iterator[Tuple[int, npt.NDArray[np.int32]]]:
+    """ Возвращает накопленные смещения этажа по блокам в виде пар (начало блока, смещения в блоке) """
+
+    for start in range(0, len(instructions), BLOCK_SIZE):
+        block = instructions[start:start + BLOCK_SIZE]
+        deltas = (block == UP).view(np.int8) - (block == DOWN).view(np.int8)
+        yield start, np.cumsum(deltas, dtype=np.int32)
+
+
+def _first_below_basement(instructions: npt.NDArray[np.uint8], floor: int = 0) -> Optional[int]:
+    """ Возвращает индекс первой инструкции, после которой Санта оказывается в подвале """
+
+    for start, floors in _floors(instructions):
+        below_basement = floors < -floor
+        if below_basement.any():
+            return start + int(np.argmax(below_basement))
+        floor += int(floors[-1])
+
+    return None
+
+
+def _summarize(instructions: npt.NDArray[np.uint8]) -> Tuple[int, int]:
+    """ Возвращает итоговое смещение этажа и минимальный накопленный этаж фрагмента инструкций """
+
+    delta, lowest = 0, 0
+    for _, floors in _floors(instructions):
+        lowest = min(lowest, delta + int(floors.min()))
+        delta += int(floors[-1])
+
+    return delta, lowest
+
+
+def basement_position(buffer: bytes) -> int:
+    """ Решение второй задачи для сырого буфера инструкций
+
+    Инструкции переводятся в смещения +1/-1 (int8), после чего по накопленной сумме
+    ищется первая позиция ниже нулевого этажа. Буфер обрабатывается блоками по BLOCK_SIZE байт.
+    """
+
+    index = _first_below_basement(np.frombuffer(buffer, dtype=np.uint8))
+    return 0 if index is None else index + 1
+
+
+# Источник инструкций для процессов пула: файл (отображается в память) или имя блока общей памяти
+Source = Union[Path, str]
+
+# Инструкции, подключенные в процессе-обработчике пула (блок общей памяти хранится,
+# чтобы он не был закрыт, пока на него ссылается массив)
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+_worker_instructions: Optional[npt.NDArray[np.uint8]] = None
+
+
+def _attach(source: Source) -> Tuple[npt.NDArray[np.uint8], Optional[shared_memory.SharedMemory]]:
+    """ Возвращает инструкции без копирования и блок общей памяти, который нужно закрыть после работы """
+
+    if isinstance(source, Path):
+        return np.memmap(source, dtype=np.uint8, mode='r'), None
+
+    memory = shared_memory.SharedMemory(name=source)
+    return np.ndarray((memory.size,), dtype=np.uint8, buffer=memory.buf), memory
+
+
+def _init_worker(source: Source) -> None:
+    """ Однократное подключение инструкций в процессе-обработчике """
+    global _worker_memory, _worker_instructions  # pylint: disable=global-statement
+    _worker_instructions, _worker_memory = _attach(source)
+
+
+def _summarize_range(start: int, stop: int) -> Tuple[int, int]:
+    """ Сводка по фрагменту [start, stop) инструкций, подключенных в процессе-обработчике """
+    assert _worker_instructions is not None
+    return _summarize(_worker_instructions[start:stop])
+
+
+def _parallel_search(source: Source, size: int, chunk_size: int, max_workers: Optional[int]) -> Optional[int]:
+    """ Возвращает индекс первой инструкции, приводящей в подвал, просматривая сводки фрагментов по порядку
+
+    Фрагменты передаются процессам в виде границ, а не данных, и отправляются по мере получения
+    результатов: одновременно в работе находится не больше двух фрагментов на процесс.
+    """
+
+    bounds = ((start, min(start + chunk_size, size)) for start in range(0, size, chunk_size))
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(source,)) as executor:
+        limit = 2 * (max_workers or os.cpu_count() or 1)
+        pending: Deque[Tuple[int, 'Future[Tuple[int, int]]']] = deque()
+        try:
+            floor = 0
+            while True:
+                while len(pending) < limit and (chunk := next(bounds, None)) is not None:
+                    pending.append((chunk[0], executor.submit(_summarize_range, *chunk)))
+                if not pending:
+                    return None
+
+                start, future = pending.popleft()
+                delta, lowest = future.result()
+                if floor + lowest < 0:
+                    instructions, memory = _attach(source)
+                    try:
+                        index = _first_below_basement(instructions[start:start + chunk_size], floor)
+                        assert index is not None
+                        return start + index
+                    finally:
+                        del instructions
+                        if memory is not None:
+                            memory.close()
+                floor += delta
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def parallel_basement_position(
+        buffer: Union[bytes, Path],
+        chunk_size: int = 1 << 26,
+        max_workers: Optional[int] = None,
+) -> int:
+    """ Решение второй задачи для сырого буфера (или файла) инструкций на нескольких процессах
+
+    Буфер делится на фрагменты, для каждого из которых параллельно вычисляются итоговое
+    смещение этажа и минимальный накопленный этаж. Последовательный просмотр этих сводок
+    (исключающая префиксная сумма) находит первый фрагмент, опускающийся ниже нулевого этажа,
+    и только он просматривается повторно. Результат совпадает с basement_position.
+
+    Процессы читают инструкции без передачи данных через канал пула: файл отображается
+    в память каждым процессом, а буфер один раз копируется в общую память.
+
+    :param buffer:      Сырой буфер инструкций или путь к файлу с ними (без копирования в память)
+    :param chunk_size:  Размер фрагмента в байтах
+    :param max_workers: Количество процессов
+    :return:            Позиция первой инструкции, приводящей в подвал (0 если такой нет)
+    """
+
+    size = buffer.stat().st_size if isinstance(buffer, Path) else len(buffer)
+    if size <= chunk_size:
+        return basement_position(buffer.read_bytes() if isinstance(buffer, Path) else buffer)
+
+    if isinstance(buffer, Path):
+        index = _parallel_search(buffer, size, chunk_size, max_workers)
+    else:
+        memory = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            cast(memoryview, memory.buf)[:size] = buffer
+            index = _parallel_search(memory.name, size, chunk_size, max_workers)
+        finally:
+            memory.close()
+            memory.unlink()
+
+    return 0 if index is None else index + 1
+
+
+class FloorIndex:
+    """ Индекс этажей для многократных запросов к одному набору инструкций
+
+    Строится один раз за O(n log n) и содержит:
+      * массив накопленных сумм - этаж после каждого шага;
+      * таблицу первого посещения для каждого достигнутого этажа;
+      * разреженные таблицы (sparse table) минимумов и максимумов этажей на отрезках.
+
+    Шаг k означает состояние после выполнения первых k инструкций (шаг 0 - нулевой этаж до начала движения).
+    """
+
+    def __init__(self, buffer: bytes) -> None:
+        instructions = np.frombuffer(buffer, dtype=np.uint8)
+        dtype = np.int32 if len(instructions) < 2 ** 31 else np.int64
+
+        self.floors: npt.NDArray[np.signedinteger[Any]] = np.zeros(len(instructions) + 1, dtype=dtype)
+        np.cumsum(
+            (instructions == UP).view(np.int8) - (instructions == DOWN).view(np.int8),
+            dtype=dtype,
+            out=self.floors[1:],
+        )
+
+        # Этаж меняется не более чем на единицу за шаг, поэтому посещенные этажи образуют
+        # непрерывный диапазон, а первое посещение этажа совпадает с обновлением рекорда
+        self.lowest: int = int(self.floors.min())
+        self.highest: int = int(self.floors.max())
+        self._first_visit: npt.NDArray[np.int64] = np.zeros(self.highest - self.lowest + 1, dtype=np.int64)
+        for accumulate in (np.maximum.accumulate, np.minimum.accumulate):
+            records = accumulate(self.floors)
+            steps = np.flatnonzero(records[1:] != records[:-1]) + 1
+            self._first_visit[records[steps] - self.lowest] = steps
+        self._first_visit[-self.lowest] = 0
+
+        self._minimums: List[npt.NDArray[np.signedinteger[Any]]] = [self.floors]
+        self._maximums: List[npt.NDArray[np.signedinteger[Any]]] = [self.floors]
+        width = 1
+        while 2 * width <= len(self.floors):
+            self._minimums.append(np.minimum(self._minimums[-1][:-width], self._minimums[-1][width:]))
+            self._maximums.append(np.maximum(self._maximums[-1][:-width], self._maximums[-1][width:]))
+            width *= 2
+
+    @property
+    def steps(self) -> int:
+        """ Возвращает количество инструкций """
+        return len(self.floors) - 1
+
+    def floor_at(self, step: int) -> int:
+        """ Возвращает этаж после указанного количества шагов """
+        return int(self.floors[step])
+
+    def first_visit(self, floor: int) -> Optional[int]:
+        """ Возвращает шаг, на котором этаж был достигнут впервые (None - этаж не достигается) """
+        if not self.lowest <= floor <= self.highest:
+            return None
+        return int(self._first_visit[floor - self.lowest])
+
+    def _level(self, start: int, stop: int) -> Tuple[int, int]:
+        """ Возвращает уровень разреженной таблицы и смещение второго перекрывающего отрезка """
+        if not 0 <= start < stop <= len(self.floors):
+            raise ValueError(f'Wrong range: [{start}, {stop})')
+        level = (stop - start).bit_length() - 1
+        return level, stop - (1 << level)
+
+    def range_min(self, start: int, stop: int) -> int:
+        """ Возвращает минимальный этаж на шагах [start, stop) """
+        level, second = self._level(start, stop)
+        return int(min(self._minimums[level][start], self._minimums[level][second]))
+
+    def range_max(self, start: int, stop: int) -> int:
+        """ Возвращает максимальный этаж на шагах [start, stop) """
+        level, second = self._level(start, stop)
+        return int(max(self._maximums[level][start], self._maximums[level][second]))
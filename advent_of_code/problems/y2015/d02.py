@@ -42,11 +42,13 @@ For example:
 How many total feet of ribbon should they order?
 """
 
-from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Tuple
+import numpy as np
+import numpy.typing as npt
+from advent_of_code.common import record
 
 
-@dataclass(frozen=True)
+@record
 class BoxDimensions:
     """ Размер коробки """
     length: int
@@ -82,3 +84,54 @@ def second_task(boxes_dimensions: Iterable[str]) -> int:
         return present_ribbon + bow_ribbon
 
     return sum(ribbon_for_box(_parse_box_dimensions(line)) for line in boxes_dimensions)
+
+
+# Разделители размеров одной коробки в строке буфера
+LINE_SEPARATORS = np.frombuffer(b'xx\n', dtype=np.uint8)
+
+
+def _parse_buffer(buffer: bytes) -> npt.NDArray[np.int64]:
+    """ Возвращает размеры всех коробок из сырого буфера в виде массива (N, 3)
+
+    Структура строк проверяется по позициям разделителей: разделители должны идти строго
+    в порядке x, x, перевод строки, а между ними - непустые числа. Поэтому, например,
+    2x3x4x1x1x10 или коробка, разнесенная на несколько строк, не принимаются за две коробки.
+    Числа собираются из цифр, стоящих перед разделителями, без разбора текста.
+    """
+
+    text = buffer.replace(b'\r', b'').rstrip()
+    if not text:
+        return np.zeros((0, 3), dtype=np.int64)
+
+    data = np.frombuffer(text + b'\n', dtype=np.uint8)
+    digits = data - np.uint8(ord('0'))
+    separators = np.flatnonzero(digits > 9)
+    lengths = np.diff(separators, prepend=-1) - 1
+    if len(separators) % 3 or lengths.min() < 1 or not (data[separators].reshape(-1, 3) == LINE_SEPARATORS).all():
+        raise ValueError('Wrong box dimensions')
+
+    # Разделители считаются нулевыми цифрами, а цифры старше длины числа отбрасываются множителем
+    digits[separators] = 0
+    dims: npt.NDArray[np.int64] = digits[separators - 1].astype(np.int64)
+    for position in range(1, int(lengths.max())):
+        dims += digits[separators - 1 - position] * ((lengths > position) * 10 ** position)
+
+    return dims.reshape(-1, 3)
+
+
+def box_totals(buffer: bytes) -> Tuple[int, int]:
+    """ Решение обеих задач для сырого буфера с размерами коробок
+
+    Размеры разбираются один раз, после чего бумага и лента считаются векторно по отсортированным
+    размерам коробок: без создания объектов для каждой коробки.
+
+    :param buffer:  Размеры коробок в формате LxWxH, по одной коробке в строке
+    :return:        Количество упаковочной бумаги и количество ленты
+    """
+
+    smallest, middle, largest = np.sort(_parse_buffer(buffer), axis=1).T
+
+    paper = 2 * (smallest * middle + middle * largest + smallest * largest) + smallest * middle
+    ribbon = 2 * (smallest + middle) + smallest * middle * largest
+
+    return int(paper.sum()), int(ribbon.sum())
@@ -37,11 +37,24 @@ For example:
 """
 
 import itertools
-from dataclasses import dataclass
-from typing import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional, Set
+import numpy as np
+import numpy.typing as npt
+from advent_of_code.common import record
 
 
-@dataclass(frozen=True)
+# Смещения по осям для каждого возможного значения байта направления
+_DX = np.zeros(256, dtype=np.int8)
+_DY = np.zeros(256, dtype=np.int8)
+_DX[ord('>')], _DX[ord('<')] = 1, -1
+_DY[ord('^')], _DY[ord('v')] = 1, -1
+
+# Множитель для упаковки пары координат в одно 64-битное число
+_PACK_FACTOR = 1 << 32
+
+
+@record
 class Position:
     """ Координаты дома """
     x: int
@@ -61,6 +74,20 @@ def _move(position: Position, direction: str) -> Position:
     return Position(position.x + dx, position.y + dy)
 
 
+def _visited_houses(directions: Iterable[str], couriers: int) -> Set[Position]:
+    """ Возвращает дома, посещенные курьерами, которые по очереди берут направления из общего потока """
+
+    origin = Position(x=0, y=0)
+    positions = [origin] * couriers
+    houses = {origin}
+
+    for courier, direction in zip(itertools.cycle(range(couriers)), itertools.chain.from_iterable(directions)):
+        positions[courier] = _move(positions[courier], direction)
+        houses.add(positions[courier])
+
+    return houses
+
+
 def first_task(directions: Iterable[str]) -> int:
     """ Решение первой задачи """
 
@@ -77,25 +104,59 @@ def first_task(directions: Iterable[str]) -> int:
 
 def second_task(directions: Iterable[str]) -> int:
     """ Решение второй задачи """
+    return len(_visited_houses(directions, couriers=2))
 
-    santa_iter, robot_iter = itertools.tee(itertools.chain.from_iterable(directions))
-    santa_directions = (direction for index, direction in enumerate(santa_iter) if index % 2 == 0)
-    robot_directions = (direction for index, direction in enumerate(robot_iter) if index % 2 == 1)
 
-    santa_houses = set(
-        itertools.accumulate(
-            santa_directions,
-            _move,
-            initial=Position(x=0, y=0),
-        )
-    )
+def _visited_keys(moves: npt.NDArray[np.uint8]) -> npt.NDArray[np.int64]:
+    """ Возвращает упакованные координаты посещенных домов (с повторами), включая начальный дом
+
+    Координаты дома (x, y) упаковываются в одно число x * 2^32 + y, поэтому каждое
+    посещение занимает 8 байт, а уникальные дома находятся сортировкой (np.unique).
+    """
+
+    keys = np.zeros(len(moves) + 1, dtype=np.int64)
+    np.cumsum(_DX[moves], dtype=np.int64, out=keys[1:])
+    keys *= _PACK_FACTOR
+    keys[1:] += np.cumsum(_DY[moves], dtype=np.int64)
+
+    return keys
+
+
+def count_houses(buffer: bytes) -> int:
+    """ Решение первой задачи для сырого буфера направлений """
+    return len(np.unique(_visited_keys(np.frombuffer(buffer, dtype=np.uint8))))
+
+
+def _courier_houses(moves: bytes) -> npt.NDArray[np.int64]:
+    """ Возвращает упакованные координаты уникальных домов, посещенных одним курьером """
+    return np.unique(_visited_keys(np.frombuffer(moves, dtype=np.uint8)))
+
+
+def count_fleet_houses(buffer: bytes, couriers: int, max_workers: Optional[int] = None) -> int:
+    """ Возвращает количество домов, посещенных K курьерами, которые по очереди берут направления
+
+    Направления распределяются между курьерами срезами с шагом K (buffer[i::K]), маршрут
+    каждого курьера считается в отдельном процессе, после чего множества домов объединяются.
+
+    :param buffer:      Сырой буфер направлений
+    :param couriers:    Количество курьеров
+    :param max_workers: Количество процессов; 1 - расчет в текущем процессе без пула
+    :return:            Количество домов, получивших хотя бы один подарок
+    """
+
+    if couriers < 1:
+        raise ValueError(f'Wrong couriers count: {couriers}')
+
+    routes = [buffer[courier::couriers] for courier in range(couriers)]
+    if max_workers == 1:
+        houses = [_courier_houses(route) for route in routes]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            houses = list(executor.map(_courier_houses, routes))
+
+    return len(np.unique(np.concatenate(houses)))
 
-    robot_houses = set(
-        itertools.accumulate(
-            robot_directions,
-            _move,
-            initial=Position(x=0, y=0),
-        )
-    )
 
-    return len(santa_houses | robot_houses)
+def count_houses_with_robot(buffer: bytes) -> int:
+    """ Решение второй задачи для сырого буфера направлений """
+    return count_fleet_houses(buffer, couriers=2, max_workers=1)
@@ -22,20 +22,80 @@ Now find one that starts with six zeroes.
 """
 
 import hashlib
-import itertools
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
 
-def _generate_hash(value: str) -> str:
-    """ Возвращает сформированный MD5-хеш для указанной строки """
-    return hashlib.md5(value.encode('utf-8')).hexdigest()
+# Последняя цифра числа: хеширование префикса из остальных цифр выполняется один раз на десяток чисел
+_LAST_DIGITS = tuple(b'%d' % digit for digit in range(10))
+
+# Разрядность MD5-хеша в битах
+DIGEST_BITS = 128
+
+
+def _threshold(bits: int) -> bytes:
+    """ Возвращает границу, меньше которой хеш начинается как минимум с указанного количества нулевых бит
+
+    Хеши сравниваются в сыром виде (bytes сравниваются лексикографически, что для одинаковой длины
+    совпадает с числовым сравнением), без построения шестнадцатеричной строки.
+    """
+
+    if not 0 < bits <= DIGEST_BITS:
+        raise ValueError(f'Wrong difficulty: {bits} bits')
+
+    return (1 << (DIGEST_BITS - bits)).to_bytes(DIGEST_BITS // 8, 'big')
+
+
+def _scan(secret: str, bits: int, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+    """ Возвращает по порядку числа из диапазона [start, stop), хеш которых начинается с нулевых бит
+
+    Состояние MD5 после секретного ключа вычисляется один раз, затем для каждого десятка чисел
+    копируется и дополняется общими старшими цифрами, а для каждого числа - только последней цифрой.
+    Цифры формируются сразу в виде bytes, без промежуточных строк.
+
+    :param secret:  Секретный ключ
+    :param bits:    Количество нулевых бит в начале хеша
+    :param start:   Первое проверяемое число
+    :param stop:    Число, на котором поиск прекращается (None - без ограничения)
+    :return:        Пары (число, сырой хеш)
+    """
+
+    threshold = _threshold(bits)
+    secret_state = hashlib.md5(secret.encode('utf-8'))
+
+    tens = start // 10
+    while stop is None or tens * 10 < stop:
+        prefix_state = secret_state.copy()
+        if tens:
+            prefix_state.update(b'%d' % tens)
+        copy = prefix_state.copy
+
+        first = tens * 10
+        lower = max(start - first, 0)
+        upper = 10 if stop is None else min(stop - first, 10)
+        for digit in range(lower, upper):
+            state = copy()
+            state.update(_LAST_DIGITS[digit])
+            if (digest := state.digest()) < threshold:
+                yield first + digit, digest
+
+        tens += 1
+
+
+def leading_zero_bits(digest: bytes) -> int:
+    """ Возвращает количество нулевых бит в начале хеша """
+    return DIGEST_BITS - int.from_bytes(digest, 'big').bit_length()
 
 
 def first_task(secret: str) -> int:
     """ Решение первой задачи """
 
-    for num in itertools.count():
-        if _generate_hash(secret + str(num)).startswith('00000'):
-            return num
+    for num, _ in _scan(secret, bits=5 * 4):
+        return num
 
     return 0
 
@@ -43,8 +103,196 @@ def first_task(secret: str) -> int:
 def second_task(secret: str) -> int:
     """ Решение второй задачи """
 
-    for num in itertools.count():
-        if _generate_hash(secret + str(num)).startswith('000000'):
-            return num
+    for num, _ in _scan(secret, bits=6 * 4):
+        return num
 
     return 0
+
+
+def first_nonces(secret: str, levels: Iterable[int]) -> Dict[int, int]:
+    """ Возвращает наименьшие числа для нескольких уровней сложности за один проход
+
+    Просмотр ведется с наименьшей сложностью; каждое найденное число засчитывается всем
+    еще не закрытым уровням, которым удовлетворяет его хеш, и поиск прекращается,
+    как только закрыты все уровни. Поэтому каждый хеш вычисляется не более одного раза.
+
+    :param secret:  Секретный ключ
+    :param levels:  Уровни сложности в битах (для N шестнадцатеричных нулей - N * 4)
+    :return:        Наименьшее число для каждого уровня сложности
+    """
+
+    # Уровни проверяются заранее: недостижимый уровень (больше DIGEST_BITS) иначе не закрылся бы никогда
+    pending = sorted(set(levels))
+    for bits in pending:
+        _threshold(bits)
+
+    result: Dict[int, int] = {}
+    if not pending:
+        return result
+
+    for num, digest in _scan(secret, bits=pending[0]):
+        zeros = leading_zero_bits(digest)
+        while pending and pending[0] <= zeros:
+            result[pending.pop(0)] = num
+        if not pending:
+            break
+
+    return result
+
+
+def both_tasks(secret: str) -> Tuple[int, int]:
+    """ Решение обеих задач за один проход """
+
+    result = first_nonces(secret, (5 * 4, 6 * 4))
+    return result[5 * 4], result[6 * 4]
+
+
+def _search_block(secret: str, zeros: int, start: int, stop: int) -> Optional[int]:
+    """ Возвращает наименьшее число из диапазона [start, stop), хеш которого начинается с нулей """
+
+    for num, _ in _scan(secret, bits=zeros * 4, start=start, stop=stop):
+        return num
+
+    return None
+
+
+def parallel_mine(
+        secret: str,
+        zeros: int,
+        block_size: int = 200_000,
+        max_workers: Optional[int] = None,
+) -> int:
+    """ Возвращает наименьшее число, хеш которого начинается с указанного количества нулей
+
+    Диапазоны чисел (блоки) раздаются процессам пула по порядку. Найденное в блоке число
+    считается ответом только после того, как все предыдущие блоки просмотрены без результата,
+    поэтому ответ совпадает с последовательным поиском. После подтверждения ответа
+    невыполненные блоки отменяются.
+
+    :param secret:      Секретный ключ
+    :param zeros:       Количество нулей в начале шестнадцатеричного представления хеша
+    :param block_size:  Количество чисел в одном блоке
+    :param max_workers: Количество процессов
+    """
+
+    workers = max_workers or os.cpu_count() or 1
+    pending: Dict['Future[Optional[int]]', int] = {}
+    results: Dict[int, Optional[int]] = {}
+    next_block = confirmed_block = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                # Блоки после уже найденного кандидата не нужны: ответ в них заведомо больше
+                found_blocks = [block for block, result in results.items() if result is not None]
+                last_block = min(found_blocks, default=None)
+                while len(pending) < 2 * workers and (last_block is None or next_block < last_block):
+                    start = next_block * block_size
+                    future = executor.submit(_search_block, secret, zeros, start, start + block_size)
+                    pending[future] = next_block
+                    next_block += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+
+                # Подтверждение блоков строго по порядку
+                while confirmed_block in results:
+                    if (result := results.pop(confirmed_block)) is not None:
+                        return result
+                    confirmed_block += 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+@dataclass
+class _Progress:
+    """ Состояние поиска для одного секретного ключа """
+
+    # Все числа меньше scanned проверены
+    scanned: int = 0
+    # Найденные числа и количество нулевых бит в начале их хешей
+    hits: Dict[int, int] = field(default_factory=dict)
+
+
+class CheckpointedMiner:
+    """ Поиск с сохранением прогресса в файл и индексом найденных чисел
+
+    Для каждого секретного ключа в файле хранится граница полностью просмотренного диапазона
+    и все найденные в нем числа, хеш которых начинается хотя бы с index_bits нулевых бит.
+    Поэтому после перезапуска поиск продолжается с сохраненной границы, а запрос
+    с меньшей сложностью (но не меньше index_bits) отвечается по индексу без хеширования.
+    """
+
+    def __init__(self, path: Path, index_bits: int = 16, interval: int = 1_000_000) -> None:
+        self.path: Path = path
+        self.index_bits: int = index_bits
+        self.interval: int = interval
+
+    def _load(self) -> Dict[str, _Progress]:
+        """ Возвращает сохраненное состояние поиска """
+
+        if not self.path.exists():
+            return {}
+
+        with open(self.path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+
+        return {
+            secret: _Progress(
+                scanned=progress['scanned'],
+                hits={int(num): bits for num, bits in progress['hits'].items()},
+            )
+            for secret, progress in data.get(str(self.index_bits), {}).items()
+        }
+
+    def _save(self, secret: str, progress: _Progress) -> None:
+        """ Атомарно сохраняет состояние поиска для секретного ключа """
+
+        data = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+
+        data.setdefault(str(self.index_bits), {})[secret] = {
+            'scanned': progress.scanned,
+            'hits': {str(num): bits for num, bits in sorted(progress.hits.items())},
+        }
+
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(temp_path, self.path)
+
+    def lookup(self, secret: str, bits: int) -> Optional[int]:
+        """ Возвращает ответ из индекса, если он уже известен """
+
+        if bits < self.index_bits:
+            return None
+
+        progress = self._load().get(secret, _Progress())
+        return min((num for num, zeros in progress.hits.items() if zeros >= bits), default=None)
+
+    def search(self, secret: str, bits: int) -> int:
+        """ Возвращает наименьшее число, хеш которого начинается с указанного количества нулевых бит """
+
+        # Такие числа не попадают в индекс, а их поиск недолог
+        if bits < self.index_bits:
+            return next(_scan(secret, bits))[0]
+
+        if (num := self.lookup(secret, bits)) is not None:
+            return num
+
+        progress = self._load().get(secret, _Progress())
+        while True:
+            start, stop = progress.scanned, progress.scanned + self.interval
+            for num, digest in _scan(secret, self.index_bits, start=start, stop=stop):
+                progress.hits[num] = leading_zero_bits(digest)
+                if progress.hits[num] >= bits:
+                    progress.scanned = num + 1
+                    self._save(secret, progress)
+                    return num
+
+            progress.scanned = stop
+            self._save(secret, progress)
@@ -51,11 +51,31 @@ For example:
 How many strings are nice under these new rules?
 """
 
-import re
-from typing import Iterable
+from typing import Iterable, Iterator, Tuple
+import numpy as np
+import numpy.typing as npt
 from advent_of_code.common import zip_with
 
 
+# Размер блока (в байтах) при разборе буфера; граница блока выравнивается по концу строки
+BLOCK_SIZE = 1 << 22
+
+NEWLINE = ord('\n')
+
+FIRST_LETTER = ord('a')
+LETTERS_COUNT = 26
+
+# Количество различных пар букв
+PAIRS_COUNT = LETTERS_COUNT * LETTERS_COUNT
+
+# Таблицы классификации байтов: гласные и первые символы запрещенных последовательностей ab, cd, pq, xy
+_VOWELS = np.zeros(256, dtype=np.bool_)
+_VOWELS[np.frombuffer(b'aeiou', dtype=np.uint8)] = True
+
+_FORBIDDEN_FIRST = np.zeros(256, dtype=np.bool_)
+_FORBIDDEN_FIRST[np.frombuffer(b'acpx', dtype=np.uint8)] = True
+
+
 def first_task(strings: Iterable[str]) -> int:
     """ Решение первой задачи """
 
@@ -77,6 +97,34 @@ def first_task(strings: Iterable[str]) -> int:
     return len([string for string in strings if all(rule(string) for rule in rules)])
 
 
+def has_repeated_pair(string: str) -> bool:
+    """ Возвращает True если строка содержит пару букв минимум дважды без пересечения
+
+    Для каждой из PAIRS_COUNT пар букв запоминается индекс ее первого вхождения: повторное вхождение
+    не пересекается с первым, если отстоит от него минимум на 2. Проверка линейна по длине строки.
+    """
+
+    first_index = [-1] * PAIRS_COUNT
+    prev = -1
+    for index, char in enumerate(string.encode()):
+        curr = char - FIRST_LETTER
+        if not 0 <= curr < LETTERS_COUNT:
+            prev = -1
+            continue
+
+        if prev >= 0:
+            pair = prev * LETTERS_COUNT + curr
+            first = first_index[pair]
+            if first < 0:
+                first_index[pair] = index
+            elif index - first >= 2:
+                return True
+
+        prev = curr
+
+    return False
+
+
 def second_task(strings: Iterable[str]) -> int:
     """ Решение второй задачи """
 
@@ -85,7 +133,7 @@ def second_task(strings: Iterable[str]) -> int:
             Возвращает True если строка содержит два символа подряд минимум
             дважды без пересечения
         """
-        return re.search(r'([a-z][a-z]).*\1', string) is not None
+        return has_repeated_pair(string)
 
     def same_letter_with_one_between(string: str) -> bool:
         """
@@ -100,3 +148,98 @@ def second_task(strings: Iterable[str]) -> int:
 
     rules = (two_letters_twice, same_letter_with_one_between)
     return len([string for string in strings if all(rule(string) for rule in rules)])
+
+
+def _blocks(buffer: bytes) -> Iterator[npt.NDArray[np.uint8]]:
+    """ Возвращает буфер блоками примерно по BLOCK_SIZE байт, каждый блок заканчивается переводом строки """
+
+    if buffer and buffer[-1] != NEWLINE:
+        buffer += b'\n'
+
+    start = 0
+    while start < len(buffer):
+        end = buffer.rfind(b'\n', start, start + BLOCK_SIZE)
+        if end < 0:
+            end = buffer.find(b'\n', start + BLOCK_SIZE)
+        yield np.frombuffer(buffer, dtype=np.uint8, count=end + 1 - start, offset=start)
+        start = end + 1
+
+
+def _lines_with(
+        line_ids: npt.NDArray[np.uint32],
+        positions: npt.NDArray[np.intp],
+        lines: int,
+) -> npt.NDArray[np.bool_]:
+    """ Возвращает признак наличия хотя бы одной из указанных позиций для каждой строки """
+
+    result = np.zeros(lines, dtype=np.bool_)
+    result[line_ids[positions]] = True
+    return result
+
+
+def _count_nice_block(block: npt.NDArray[np.uint8]) -> Tuple[int, int]:
+    """ Возвращает количество хороших строк блока по правилам обеих задач """
+
+    ends = np.flatnonzero(block == NEWLINE)
+    lines = len(ends)
+    line_ids = np.repeat(np.arange(lines, dtype=np.uint32), np.diff(ends, prepend=-1))
+
+    # Номер буквы в алфавите; для остальных байтов (перевод строки, \r) - не меньше LETTERS_COUNT
+    indexes = block - np.uint8(FIRST_LETTER)
+    letters = indexes < LETTERS_COUNT
+    pairs = letters[:-1] & letters[1:]
+    prev, curr = block[:-1], block[1:]
+    same = pairs & (prev == curr)
+
+    vowels = np.flatnonzero(np.take(_VOWELS, block))
+    enough_vowels = np.bincount(line_ids[vowels], minlength=lines) >= 3
+    double_letter = _lines_with(line_ids, np.flatnonzero(same), lines)
+
+    # Кандидаты в запрещенные последовательности - пары соседних по алфавиту букв
+    steps = np.flatnonzero(pairs & (curr - prev == 1))
+    forbidden = _lines_with(line_ids, steps[_FORBIDDEN_FIRST[prev[steps]]], lines)
+
+    between = pairs[:-1] & pairs[1:] & (block[:-2] == block[2:])
+    one_between = _lines_with(line_ids, np.flatnonzero(between), lines)
+
+    # Вхождения одной пары пересекаются только в серии одинаковых букв (aaa): второе вхождение
+    # такой серии отбрасывается, после чего строка подходит, если в ней есть две одинаковые пары
+    overlap = np.zeros(len(pairs), dtype=np.bool_)
+    overlap[1:] = same[1:] & same[:-1]
+    kept = pairs.copy()
+    kept[1:] &= ~(overlap[1:] & ~overlap[:-1])
+
+    # Номер строки в блоке меньше 2^32 / PAIRS_COUNT, поэтому ключ помещается в uint32
+    kept_positions = np.flatnonzero(kept)
+    keys = line_ids[kept_positions] * np.uint32(PAIRS_COUNT)
+    keys += indexes[kept_positions].astype(np.uint32) * np.uint32(LETTERS_COUNT)
+    keys += indexes[kept_positions + 1]
+    keys.sort()
+    repeated = np.flatnonzero(keys[1:] == keys[:-1])
+    two_pairs = np.zeros(lines, dtype=np.bool_)
+    two_pairs[keys[repeated] // PAIRS_COUNT] = True
+
+    first = np.count_nonzero(enough_vowels & double_letter & ~forbidden)
+    second = np.count_nonzero(two_pairs & one_between)
+
+    return int(first), int(second)
+
+
+def count_nice(buffer: bytes) -> Tuple[int, int]:
+    """ Решение обеих задач для сырого буфера со строками
+
+    Все правила обеих задач проверяются за одно чтение буфера: байты классифицируются
+    через таблицы на 256 элементов, а признаки правил собираются по строкам векторно,
+    без вызова функций для каждого символа.
+
+    :param buffer:  Строки, разделенные переводом строки
+    :return:        Количество хороших строк по правилам первой и второй задач
+    """
+
+    first = second = 0
+    for block in _blocks(buffer):
+        block_first, block_second = _count_nice_block(block)
+        first += block_first
+        second += block_second
+
+    return first, second
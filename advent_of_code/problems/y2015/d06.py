@@ -49,11 +49,15 @@ For example:
 """
 
 import array
-import itertools
+import os
 import re
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from enum import unique, Enum, IntEnum
-from typing import Iterable, Iterator, Callable, Optional
+from typing import Any, Dict, Iterable, Iterator, Callable, List, Optional, Sequence, Tuple
+import numpy as np
+import numpy.typing as npt
+from advent_of_code.common import Task, record
 
 # Максимальный размер гирлянды с лампочками
 MAX_GRID_SIZE = 1000
@@ -67,14 +71,14 @@ class Action(Enum):
     toggle = 'toggle'
 
 
-@dataclass(frozen=True)
+@record
 class Point:
     """ Координата на плоскости """
     x: int
     y: int
 
 
-@dataclass(frozen=True)
+@record
 class Range:
     """ Диапазон точек на плоскости """
 
@@ -88,27 +92,98 @@ class Range:
                 yield Point(x, y)
 
 
-@dataclass(frozen=True)
+@record
 class Command:
     """ Входная команда на изменение состояния лампочек """
     action: Action
     range: Range
 
 
-@dataclass(frozen=True)
+@record
+class Totals:
+    """ Количество горящих лампочек и их суммарная яркость """
+    lit: int
+    brightness: int
+
+
+@record
 class Light:
     """ Лампочка """
     brightness: int
     location: Point
 
 
+class SummedArea:
+    """ Таблицы префиксных сумм (summed-area table) яркости и количества горящих лампочек
+
+    Элемент [y, x] таблицы - сумма по прямоугольнику от (0, 0) до (x - 1, y - 1) включительно,
+    поэтому сумма по любому прямоугольнику вычисляется по четырем элементам таблицы.
+    """
+
+    def __init__(self, grid: npt.NDArray[np.integer[Any]]) -> None:
+        self.brightness_table: npt.NDArray[np.int64] = self._build(grid)
+        self.lit_table: npt.NDArray[np.int64] = self._build(grid > 0)
+
+    @staticmethod
+    def _build(grid: npt.NDArray[Any]) -> npt.NDArray[np.int64]:
+        """ Возвращает таблицу префиксных сумм с нулевыми первой строкой и первым столбцом """
+
+        height, width = grid.shape
+        table = np.zeros((height + 1, width + 1), dtype=np.int64)
+        np.cumsum(grid, axis=0, dtype=np.int64, out=table[1:, 1:])
+        np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+        return table
+
+    @staticmethod
+    def _region_sum(table: npt.NDArray[np.int64], ranges: npt.NDArray[np.intp]) -> npt.NDArray[np.int64]:
+        """ Возвращает суммы по прямоугольникам, заданным строками (left, top, right, bottom) """
+
+        left, top, right, bottom = ranges.T
+        result: npt.NDArray[np.int64] = (
+            table[bottom + 1, right + 1] - table[top, right + 1] - table[bottom + 1, left] + table[top, left]
+        )
+        return result
+
+    def query(self, ranges: npt.ArrayLike) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """ Возвращает суммарную яркость и количество горящих лампочек для набора прямоугольников
+
+        :param ranges:  Массив формы (N, 4) со строками (left, top, right, bottom), границы включаются
+        :return:        Массивы суммарной яркости и количества горящих лампочек длины N
+        """
+
+        ranges = np.asarray(ranges, dtype=np.intp)
+        if ranges.ndim != 2 or ranges.shape[1] != 4:
+            raise ValueError(f'Wrong ranges shape: {ranges.shape}')
+
+        height, width = self.brightness_table.shape[0] - 1, self.brightness_table.shape[1] - 1
+        left, top, right, bottom = ranges.T
+        valid = (0 <= left) & (left <= right) & (right < width) & (0 <= top) & (top <= bottom) & (bottom < height)
+        if not valid.all():
+            raise ValueError(f'Wrong ranges: {ranges[~valid].tolist()}')
+
+        return self._region_sum(self.brightness_table, ranges), self._region_sum(self.lit_table, ranges)
+
+    def brightness(self, area: Range) -> int:
+        """ Возвращает суммарную яркость лампочек в диапазоне """
+        return int(self.query(_range_bounds(area))[0][0])
+
+    def lit(self, area: Range) -> int:
+        """ Возвращает количество горящих лампочек в диапазоне """
+        return int(self.query(_range_bounds(area))[1][0])
+
+
+def _range_bounds(area: Range) -> npt.NDArray[np.intp]:
+    """ Возвращает границы диапазона в виде массива для SummedArea.query """
+    return np.array([[area.top.x, area.top.y, area.bottom.x, area.bottom.y]])
+
+
 class Garland:
     """ Гирлянда из лампочек """
 
     def __init__(self, grid_size: int, def_brightness: int = 0) -> None:
         self.grid_size: int = grid_size
         self.garland_range: Range = Range(top=Point(0, 0), bottom=Point(grid_size - 1, grid_size - 1))
-        self.garland: array.array = array.array('i', itertools.repeat(def_brightness, grid_size * grid_size))
+        self.garland: 'array.array[int]' = array.array('i', [def_brightness]) * (grid_size * grid_size)
 
     def _get_light_brightness(self, point: Point) -> int:
         """ Возвращает состояние (яркость) лампочки исходя из двумерных координат """
@@ -138,6 +213,43 @@ class Garland:
                 location=point,
             )
 
+    @property
+    def grid(self) -> npt.NDArray[np.intc]:
+        """ Возвращает гирлянду в виде двумерного массива (без копирования, изменения массива видны в гирлянде) """
+        return np.frombuffer(self.garland, dtype=np.intc).reshape(self.grid_size, self.grid_size)
+
+    def update(self, cmd: Command, task: Task) -> None:
+        """ Применение команды ко всему прямоугольнику лампочек одной операцией над срезом массива """
+        top, bottom = cmd.range.top, cmd.range.bottom
+        SLICE_RULES[task][cmd.action](self.grid[top.y:bottom.y + 1, top.x:bottom.x + 1])
+
+    def totals(self) -> Totals:
+        """ Возвращает количество горящих лампочек и суммарную яркость гирлянды """
+        grid = self.grid
+        return Totals(lit=int(np.count_nonzero(grid)), brightness=int(grid.sum(dtype=np.int64)))
+
+    def timeline(self, commands: Iterable[Command], task: Task) -> Iterator[Totals]:
+        """ Применяет команды и возвращает состояние гирлянды после каждой из них
+
+        Состояние пересчитывается по содержимому прямоугольника команды до и после ее применения,
+        поэтому построение всей последовательности обходится примерно как одно применение команд.
+        """
+
+        grid, rules, totals = self.grid, SLICE_RULES[task], self.totals()
+        lit, brightness = totals.lit, totals.brightness
+        for command in commands:
+            top, bottom = command.range.top, command.range.bottom
+            cells = grid[top.y:bottom.y + 1, top.x:bottom.x + 1]
+            old_lit, old_brightness = np.count_nonzero(cells), cells.sum(dtype=np.int64)
+            rules[command.action](cells)
+            lit += int(np.count_nonzero(cells) - old_lit)
+            brightness += int(cells.sum(dtype=np.int64) - old_brightness)
+            yield Totals(lit=lit, brightness=brightness)
+
+    def summed_area(self) -> SummedArea:
+        """ Возвращает таблицы префиксных сумм текущего состояния гирлянды для запросов по прямоугольникам """
+        return SummedArea(self.grid)
+
 
 def _parse_input(commands: Iterable[str]) -> Iterator[Command]:
     """ Возвращает команду для вкл/выкл лампочек исходя из строкового представления """
@@ -154,52 +266,262 @@ def _parse_input(commands: Iterable[str]) -> Iterator[Command]:
             )
 
 
-def first_task(commands: Iterable[str]) -> int:
-    """ Решение первой задачи """
+@unique
+class Switch(IntEnum):
+    """ Дискретные значения яркости лампочки (первая задача) """
+    off = 0
+    on = 1
 
-    @unique
-    class Light(IntEnum):
-        """ Дискретные значения яркости лампочки """
-        off = 0
-        on = 1
 
-    def calculate_light_brightness(action: Action, light: Light) -> int:
-        """ Расчет яркости лампочки """
-        return {
-            action.on: Light.on.value,
-            action.off: Light.off.value,
-            action.toggle: abs(Light.on.value - light.brightness),
-        }[action]
+@unique
+class BrightnessChange(IntEnum):
+    """ Изменение яркости лампочки (вторая задача) """
+    off = -1
+    on = 1
+    toggle = 2
 
-    garland = Garland(MAX_GRID_SIZE)
 
-    for command in _parse_input(commands):
-        garland.apply(command, calculate_light_brightness)
+@unique
+class Engine(Enum):
+    """ Способ применения команд к гирлянде """
+    cells = 'cells'
+    numpy = 'numpy'
+    compressed = 'compressed'
+    bitset = 'bitset'
+    banded = 'banded'
 
-    return len([x for x in garland.iterate() if x.brightness == Light.on.value])
 
+def _switch_light(action: Action, light: Light) -> int:
+    """ Расчет яркости лампочки для первой задачи """
+    return {
+        action.on: Switch.on.value,
+        action.off: Switch.off.value,
+        action.toggle: abs(Switch.on.value - light.brightness),
+    }[action]
 
-def second_task(commands: Iterable[str]) -> int:
-    """ Решение второй задачи """
 
-    @unique
-    class Light(IntEnum):
-        """ Дискретные значения яркости лампочки """
-        off = -1
-        on = 1
-        toggle = 2
-
-    def calculate_light_brightness(action: Action, light: Light) -> int:
-        """ Расчет яркости лампочки """
-        brightness_change = {
-            action.on: Light.on.value,
-            action.off: Light.off.value,
-            action.toggle: Light.toggle.value,
-        }
-        return max(0, light.brightness + brightness_change[action])
-
-    garland = Garland(MAX_GRID_SIZE)
-    for command in _parse_input(commands):
-        garland.apply(command, calculate_light_brightness)
+def _change_brightness(action: Action, light: Light) -> int:
+    """ Расчет яркости лампочки для второй задачи """
+    return max(0, light.brightness + BrightnessChange[action.value].value)
+
+
+# Расчет яркости отдельной лампочки в разрезе задач
+CELL_RULES: Dict[Task, Callable[[Action, Light], int]] = {
+    Task.first: _switch_light,
+    Task.second: _change_brightness,
+}
+
+
+def _clipped_subtract(cells: npt.NDArray[np.integer[Any]]) -> None:
+    """ Уменьшает яркость лампочек на 1, но не ниже нуля """
+    np.subtract(cells, 1, out=cells)
+    np.maximum(cells, 0, out=cells)
+
+
+# Изменение яркости прямоугольника лампочек одной операцией над срезом массива в разрезе задач
+SLICE_RULES: Dict[Task, Dict[Action, Callable[[npt.NDArray[np.integer[Any]]], None]]] = {
+    Task.first: {
+        Action.on: lambda cells: cells.fill(Switch.on.value),
+        Action.off: lambda cells: cells.fill(Switch.off.value),
+        Action.toggle: lambda cells: np.bitwise_xor(cells, Switch.on.value, out=cells),
+    },
+    Task.second: {
+        Action.on: lambda cells: np.add(cells, BrightnessChange.on.value, out=cells),
+        Action.off: _clipped_subtract,
+        Action.toggle: lambda cells: np.add(cells, BrightnessChange.toggle.value, out=cells),
+    },
+}
+
+
+def _cells_engine(commands: Iterable[Command], task: Task, grid_size: int) -> int:
+    """ Возвращает суммарную яркость гирлянды, обрабатывая каждую лампочку по отдельности """
+
+    garland = Garland(grid_size)
+    for command in commands:
+        garland.apply(command, CELL_RULES[task])
 
     return sum(x.brightness for x in garland.iterate())
+
+
+def apply_commands(commands: Iterable[Command], task: Task, grid_size: int = MAX_GRID_SIZE) -> npt.NDArray[np.intc]:
+    """ Возвращает итоговое состояние гирлянды в виде двумерного массива, применяя каждую команду к его срезу """
+
+    garland = Garland(grid_size)
+    for command in commands:
+        garland.update(command, task)
+
+    return garland.grid
+
+
+def _numpy_engine(commands: Iterable[Command], task: Task, grid_size: int) -> int:
+    """ Возвращает суммарную яркость гирлянды, применяя каждую команду к срезу двумерного массива """
+    return int(apply_commands(commands, task, grid_size).sum(dtype=np.int64))
+
+
+def _edges(starts: Sequence[int], stops: Sequence[int], grid_size: int) -> npt.NDArray[np.intp]:
+    """ Возвращает упорядоченные границы полос, внутри которых все команды действуют одинаково """
+    return np.unique(np.concatenate(([0, grid_size], starts, stops)))
+
+
+def _compressed_engine(commands: Iterable[Command], task: Task, grid_size: int) -> int:
+    """ Возвращает суммарную яркость гирлянды, сжимая координаты до границ прямоугольников команд
+
+    Ячейка сжатой сетки - прямоугольник между соседними границами, все лампочки которого
+    всегда имеют одинаковую яркость. Поэтому команды применяются к сжатой сетке, а при суммировании
+    яркость ячейки умножается на ее площадь. Затраты зависят от количества команд, а не от размера гирлянды.
+    """
+
+    commands = list(commands)
+    xs = _edges([cmd.range.top.x for cmd in commands], [cmd.range.bottom.x + 1 for cmd in commands], grid_size)
+    ys = _edges([cmd.range.top.y for cmd in commands], [cmd.range.bottom.y + 1 for cmd in commands], grid_size)
+    column = {x: index for index, x in enumerate(xs.tolist())}
+    row = {y: index for index, y in enumerate(ys.tolist())}
+
+    grid = np.zeros((len(ys) - 1, len(xs) - 1), dtype=np.int64)
+    rules = SLICE_RULES[task]
+    for command in commands:
+        top, bottom = command.range.top, command.range.bottom
+        rules[command.action](grid[row[top.y]:row[bottom.y + 1], column[top.x]:column[bottom.x + 1]])
+
+    heights, widths = np.diff(ys), np.diff(xs)
+    return int(heights @ grid @ widths)
+
+
+def _bitset_engine(commands: Iterable[Command], task: Task, grid_size: int) -> int:
+    """ Возвращает количество горящих лампочек, храня каждую строку гирлянды одним целым числом
+
+    Бит x числа строки - состояние лампочки в столбце x, поэтому команда для строки выполняется одной
+    побитовой операцией с маской столбцов. Подходит только для первой задачи (лампочка вкл/выкл).
+    """
+
+    if task is not Task.first:
+        raise ValueError(f'Bitset engine does not support task: {task.name}')
+
+    rows = [0] * grid_size
+    for command in commands:
+        top, bottom = command.range.top, command.range.bottom
+        mask = ((1 << (bottom.x - top.x + 1)) - 1) << top.x
+        if command.action is Action.on:
+            for y in range(top.y, bottom.y + 1):
+                rows[y] |= mask
+        elif command.action is Action.off:
+            for y in range(top.y, bottom.y + 1):
+                rows[y] &= ~mask
+        else:
+            for y in range(top.y, bottom.y + 1):
+                rows[y] ^= mask
+
+    # int.bit_count появился только в Python 3.10
+    return sum(bin(row).count('1') for row in rows)
+
+
+def _apply_band(
+        memory_name: str,
+        grid_size: int,
+        start: int,
+        stop: int,
+        commands: Sequence[Command],
+        task: Task,
+) -> int:
+    """ Применяет команды к полосе строк [start, stop) гирлянды в общей памяти и возвращает ее суммарную яркость """
+
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        band = np.ndarray(
+            (stop - start, grid_size),
+            dtype=np.int32,
+            buffer=memory.buf,
+            offset=start * grid_size * np.dtype(np.int32).itemsize,
+        )
+        band.fill(0)
+
+        rules = SLICE_RULES[task]
+        for command in commands:
+            top, bottom = command.range.top, command.range.bottom
+            first, last = max(top.y, start), min(bottom.y + 1, stop)
+            if first < last:
+                rules[command.action](band[first - start:last - start, top.x:bottom.x + 1])
+
+        result = int(band.sum(dtype=np.int64))
+        del band
+        return result
+    finally:
+        memory.close()
+
+
+def _bands(grid_size: int, count: int) -> List[Tuple[int, int]]:
+    """ Возвращает границы полос строк примерно одинаковой высоты """
+    bounds = [grid_size * index // count for index in range(count + 1)]
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if start < stop]
+
+
+def parallel_apply(
+        commands: Iterable[Command],
+        task: Task,
+        grid_size: int,
+        bands: Optional[int] = None,
+        max_workers: Optional[int] = None,
+) -> int:
+    """ Возвращает суммарную яркость гирлянды, применяя команды к горизонтальным полосам параллельно
+
+    Гирлянда размещается в общей памяти и делится на полосы строк. Каждый процесс обрезает все команды
+    по границам своей полосы и применяет их независимо: команды затрагивают только прямоугольники,
+    поэтому полосы не пересекаются. Суммарная яркость складывается из сумм по полосам.
+
+    :param bands:       Количество полос (по умолчанию - количество процессов)
+    :param max_workers: Количество процессов; 1 - обработка полос в текущем процессе без пула
+    """
+
+    commands = list(commands)
+    bands = bands or max_workers or os.cpu_count() or 1
+    memory = shared_memory.SharedMemory(create=True, size=max(grid_size * grid_size * np.dtype(np.int32).itemsize, 1))
+    try:
+        jobs = [(memory.name, grid_size, start, stop, commands, task) for start, stop in _bands(grid_size, bands)]
+        if max_workers == 1:
+            return sum(_apply_band(*job) for job in jobs)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return sum(executor.map(_apply_band, *zip(*jobs)))
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def _banded_engine(commands: Iterable[Command], task: Task, grid_size: int) -> int:
+    """ Возвращает суммарную яркость гирлянды, обрабатывая полосы строк в отдельных процессах """
+    return parallel_apply(commands, task, grid_size)
+
+
+# Реализации применения команд (для первой задачи суммарная яркость равна количеству горящих лампочек)
+ENGINES: Dict[Engine, Callable[[Iterable[Command], Task, int], int]] = {
+    Engine.cells: _cells_engine,
+    Engine.numpy: _numpy_engine,
+    Engine.compressed: _compressed_engine,
+    Engine.bitset: _bitset_engine,
+    Engine.banded: _banded_engine,
+}
+
+
+def timeline(commands: Iterable[str], task: Task, grid_size: int = MAX_GRID_SIZE) -> Iterator[Totals]:
+    """ Возвращает количество горящих лампочек и суммарную яркость после каждой команды """
+    return Garland(grid_size).timeline(_parse_input(commands), task)
+
+
+def summed_area(commands: Iterable[str], task: Task, grid_size: int = MAX_GRID_SIZE) -> SummedArea:
+    """ Возвращает таблицы префиксных сумм итогового состояния гирлянды для запросов по прямоугольникам """
+
+    garland = Garland(grid_size)
+    for command in _parse_input(commands):
+        garland.update(command, task)
+
+    return garland.summed_area()
+
+
+def first_task(commands: Iterable[str], engine: Engine = Engine.numpy, grid_size: int = MAX_GRID_SIZE) -> int:
+    """ Решение первой задачи """
+    return ENGINES[engine](_parse_input(commands), Task.first, grid_size)
+
+
+def second_task(commands: Iterable[str], engine: Engine = Engine.numpy, grid_size: int = MAX_GRID_SIZE) -> int:
+    """ Решение второй задачи """
+    return ENGINES[engine](_parse_input(commands), Task.second, grid_size)
@@ -54,11 +54,10 @@ Now, take the signal you got on wire a, override wire b to that signal, and rese
 """
 
 import collections
-import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from enum import Enum, unique
 from typing import DefaultDict, Dict, List, Optional, Set, Union, Iterable, Callable, MutableMapping
+from advent_of_code.common import ParseSpec, record
 
 
 Wire = str
@@ -135,7 +134,7 @@ class Operand:
         return cls(type=OperandType.wire, value=value)
 
 
-@dataclass(frozen=True)
+@record
 class Command(ABC):
     """ Команда на изменение сигнала проводников """
 
@@ -181,6 +180,8 @@ class Command(ABC):
 class AndCommand(Command):
     """ Обработка команды AND """
 
+    __slots__ = ()
+
     def execute(self, storage: Storage) -> int:
         """ Выполнение команды """
         first, second = self.first_operand.value(storage), self.second_operand.value(storage)
@@ -190,6 +191,8 @@ class AndCommand(Command):
 class AssignCommand(Command):
     """ Обработка команды присвоения значения проводнику """
 
+    __slots__ = ()
+
     def execute(self, storage: Storage) -> int:
         """ Выполнение команды """
 
@@ -203,6 +206,8 @@ class AssignCommand(Command):
 class LShiftCommand(Command):
     """ Обработка команды LSHIFT """
 
+    __slots__ = ()
+
     def execute(self, storage: Storage) -> int:
         """ Выполнение команды """
         first, second = self.first_operand.value(storage), self.second_operand.value(storage)
@@ -212,6 +217,8 @@ class LShiftCommand(Command):
 class NotCommand(Command):
     """ Обработка команды NOT """
 
+    __slots__ = ()
+
     def execute(self, storage: Storage) -> int:
         """ Выполнение команды """
         first = self.first_operand.value(storage)
@@ -221,6 +228,8 @@ class NotCommand(Command):
 class OrCommand(Command):
     """ Обработка команды OR """
 
+    __slots__ = ()
+
     def execute(self, storage: Storage) -> int:
         """ Выполнение команды """
         first, second = self.first_operand.value(storage), self.second_operand.value(storage)
@@ -230,6 +239,8 @@ class OrCommand(Command):
 class RShiftCommand(Command):
     """ Обработка команды RSHIFT """
 
+    __slots__ = ()
+
     def execute(self, storage: Storage) -> int:
         """ Выполнение команды """
         first, second = self.first_operand.value(storage), self.second_operand.value(storage)
@@ -306,38 +317,43 @@ class Simulator:
         return self.storage[result_wire]
 
 
-def _parse_input(string: str) -> Command:
-    """ Возвращает сформированную команду исходя из строкового представления """
-
-    binary_keywords = '|'.join(keyword.value for keyword in BinaryOperations)
-    unary_keywords = '|'.join(keyword.value for keyword in UnaryOperations)
-
-    binary_operation_template = r'(\w+)\s+({})\s+(\w+) -> (\w+)'.format(binary_keywords)
-    if (match := re.match(binary_operation_template, string)) is not None:
-        return _command_factory(
-            first_operand=match.group(1),
-            operation=match.group(2),
-            second_operand=match.group(3),
-            result_wire=match.group(4),
-        )
-
-    unary_operation_template = r'({})\s+(\w+) -> (\w+)'.format(unary_keywords)
-    if (match := re.match(unary_operation_template, string)) is not None:
-        return _command_factory(
-            first_operand=match.group(2),
-            operation=match.group(1),
-            result_wire=match.group(3),
-        )
-
-    assign_operation_template = r'(\w+) -> (\w+)'
-    if (match := re.match(assign_operation_template, string)) is not None:
-        return _command_factory(
-            first_operand=match.group(1),
+# Шаблоны команд: правило выбирается по ключевому слову операции, для присваивания - по стрелке
+COMMAND_SPEC: ParseSpec[Command] = ParseSpec(
+    (
+        tuple(keyword.value for keyword in UnaryOperations),
+        r'({})\s+(\w+) -> (\w+)'.format('|'.join(keyword.value for keyword in UnaryOperations)),
+        lambda operation, first_operand, result_wire: _command_factory(
+            operation=operation,
+            first_operand=first_operand,
+            result_wire=result_wire,
+        ),
+    ),
+    (
+        tuple(keyword.value for keyword in BinaryOperations),
+        r'(\w+)\s+({})\s+(\w+) -> (\w+)'.format('|'.join(keyword.value for keyword in BinaryOperations)),
+        lambda first_operand, operation, second_operand, result_wire: _command_factory(
+            first_operand=first_operand,
+            operation=operation,
+            second_operand=second_operand,
+            result_wire=result_wire,
+        ),
+    ),
+    (
+        ('->',),
+        r'(\w+) -> (\w+)',
+        lambda first_operand, result_wire: _command_factory(
+            first_operand=first_operand,
             operation=OperationName.op_assign.value,
-            result_wire=match.group(2),
-        )
+            result_wire=result_wire,
+        ),
+    ),
+    error='Wrong command',
+)
+
 
-    raise ValueError(f'Wrong command: {string}')
+def _parse_input(string: str) -> Command:
+    """ Возвращает сформированную команду исходя из строкового представления """
+    return COMMAND_SPEC.parse(string)
 
 
 def first_task(strings: Iterable[str], result_wire: Wire) -> int:
@@ -27,13 +27,12 @@ What is the distance of the shortest route?
 --- Part Two ---
 """
 
-import re
 from collections import defaultdict
-from dataclasses import dataclass
 from typing import Iterable, Mapping, Tuple, Dict
+from advent_of_code.common import ParseSpec, record
 
 
-@dataclass(frozen=True)
+@record
 class Route:
     """ Маршрут """
     departure: str
@@ -41,18 +40,20 @@ class Route:
     length: int
 
 
-def _parse_input(string: str) -> Route:
-    """ Возвращает маршрут из строкового представления """
+# Шаблон описания маршрута
+ROUTE_SPEC: ParseSpec[Route] = ParseSpec(
+    (
+        ('to',),
+        r'(\w+) to (\w+) = (\d+)',
+        lambda departure, arrival, length: Route(departure=departure, arrival=arrival, length=int(length)),
+    ),
+    error='Wrong route',
+)
 
-    template = r'(\w+) to (\w+) = (\w+)'
-    if (match := re.match(template, string)) is not None:
-        return Route(
-            departure=match.group(1),
-            arrival=match.group(2),
-            length=int(match.group(3)),
-        )
 
-    raise ValueError(f'Wrong route: {string}')
+def _parse_input(string: str) -> Route:
+    """ Возвращает маршрут из строкового представления """
+    return ROUTE_SPEC.parse(string)
 
 
 def first_task(strings: Iterable[str]) -> int:
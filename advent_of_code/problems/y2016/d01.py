@@ -32,9 +32,9 @@ you visit twice is 4 blocks away, due East.
 How many blocks away is the first location you visit twice?
 """
 
-from dataclasses import dataclass
 from enum import Enum, unique
 from typing import Iterable, Iterator, List, Optional
+from advent_of_code.common import record
 
 
 @unique
@@ -60,14 +60,14 @@ class Turn(Enum):
     right = 'R'
 
 
-@dataclass(frozen=True)
+@record
 class Command:
     """ Команда для продвижения по городу """
     turn: Turn
     blocks: int
 
 
-@dataclass(frozen=True)
+@record
 class Point:
     """ Точка на карте """
     x: int
@@ -96,7 +96,7 @@ class Interval:
         return f'start={self.start} finish={self.finish}'
 
 
-@dataclass(frozen=True)
+@record
 class Position:
     """ Расположение и ориентация на карте """
     point: Point
@@ -39,13 +39,13 @@ What is the bathroom code?
 
 """
 
-from dataclasses import dataclass
 from typing import Iterable
+from advent_of_code.common import record
 
 keypad_size = 3
 
 
-@dataclass(frozen=True)
+@record
 class Button:
     """ Кнопка на клавиатуре """
 
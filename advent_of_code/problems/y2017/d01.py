@@ -62,20 +62,31 @@ from typing import Iterable
 def first_task(strings: Iterable[str]) -> int:
     """ Решение первой задачи """
 
-    digits = [int(digit) for digit in itertools.chain.from_iterable(strings)]
+    # Достаточно помнить первую и предыдущую цифры: последовательность читается за один проход
+    result = 0
+    first = previous = None
+    for digit in map(int, itertools.chain.from_iterable(strings)):
+        if digit == previous:
+            result += digit
+        if first is None:
+            first = digit
+        previous = digit
 
-    # Разбиение последовательности цифр на группы по две цифры
-    pairs = zip(digits, digits[1:] + digits[:1])
+    # Последовательность замкнута: последняя цифра сравнивается с первой
+    if first is not None and first == previous:
+        result += first
 
-    # Подсчет результата
-    return sum(fst for fst, snd in pairs if fst == snd)
+    return result
 
 
 def second_task(strings: Iterable[str]) -> int:
     """ Решение второй задачи """
 
     result = 0
-    digits = [int(digit) for digit in itertools.chain.from_iterable(strings)]
+
+    # Для сравнения с цифрой на половине окружности нужна вся последовательность,
+    # поэтому цифры хранятся компактно - по одному байту на цифру
+    digits = bytearray(map(int, itertools.chain.from_iterable(strings)))
     halfway_around = len(digits) // 2
 
     for index, digit in enumerate(digits):
@@ -51,9 +51,9 @@ So, the first few squares' values are chosen as follows:
 What is the first value written that is larger than your puzzle input?
 """
 
-from dataclasses import dataclass
 from enum import unique, Enum
 from typing import Dict, Callable, Iterable, Optional, Tuple
+from advent_of_code.common import record
 
 
 @unique
@@ -65,7 +65,7 @@ class Direction(Enum):
     south = (0, -1)
 
 
-@dataclass(frozen=True)
+@record
 class Point:
     """ Координаты ячейки в таблице """
     x: int
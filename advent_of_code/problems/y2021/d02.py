@@ -1,18 +1,17 @@
 """ Day 02: Dive! """
 
-import re
-from dataclasses import dataclass
 from typing import Iterable
+from advent_of_code.common import ParseSpec, record
 
 
-@dataclass(frozen=True)
+@record
 class Command:
     """ Описание команды на изменение курса """
     action: str
     offset: int
 
 
-@dataclass(frozen=True)
+@record
 class Point:
     """ Местоположение в пространстве """
     forward: int
@@ -20,14 +19,20 @@ class Point:
     aim: int = 0
 
 
-def _parse(command: str) -> Command:
-    """ Возвращает команду на изменение курса исходя из строкового представления """
+# Шаблон команды на изменение курса
+COMMAND_SPEC: ParseSpec[Command] = ParseSpec(
+    (
+        ('down', 'forward', 'up'),
+        r'(down|forward|up)\s+(\d+)',
+        lambda action, offset: Command(action=action, offset=int(offset)),
+    ),
+    error='Unknown command',
+)
 
-    template = re.compile(r'(down|forward|up).(\d+)')
-    if res := re.search(template, command):
-        return Command(action=res.group(1), offset=int(res.group(2)))
 
-    raise ValueError(f'Unknown command: {command}')
+def _parse(command: str) -> Command:
+    """ Возвращает команду на изменение курса исходя из строкового представления """
+    return COMMAND_SPEC.parse(command)
 
 
 def first_task(strings: Iterable[str]) -> int:
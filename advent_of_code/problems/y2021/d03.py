@@ -113,9 +113,10 @@ then multiply them together. What is the life support rating of the submarine?
 (Be sure to represent your answer in decimal, not binary.)
 """
 
+import array
 import typing
 from collections import defaultdict, Counter
-from typing import Iterable, Tuple, Dict, DefaultDict
+from typing import Iterable, Dict, DefaultDict
 from more_itertools import first, last
 
 
@@ -156,26 +157,37 @@ def first_task(strings: Iterable[str]):
 def second_task(strings: Iterable[str]) -> int:
     """ Решение второй задачи """
 
-    def _recursive_search(values: Tuple[str, ...], keep_most: bool, index: int = 0) -> str:
+    # Для фильтрации нужны все значения, поэтому они хранятся компактно - числами в array,
+    # а входные данные читаются за один проход
+    values = array.array('Q')
+    width = 0
+    for string in strings:
+        value = string.strip()
+        width = max(width, len(value))
+        values.append(int(value, 2))
 
-        if len(values) == 1:
-            return first(values) or ''
+    def _search(keep_most: bool) -> int:
+        candidates = values
+        for shift in reversed(range(width)):
+            if len(candidates) == 1:
+                break
 
-        frequency = _char_frequency(values)
-        most_common_char, most_common_value = first(frequency[index].most_common()) or ('', 0)
-        least_common_char, least_common_value = last(frequency[index].most_common()) or ('', 0)
+            ones = sum((value >> shift) & 1 for value in candidates)
+            zeros = len(candidates) - ones
 
-        # Выбор символа для фильтрации
-        if most_common_value != least_common_value:
-            choosing_char = most_common_char if keep_most else least_common_char
-        else:
-            choosing_char = (max if keep_most else min)(most_common_char, least_common_char)
+            # Выбор бита для фильтрации
+            if not zeros or not ones:
+                bit = 1 if ones else 0
+            elif keep_most:
+                bit = 1 if ones >= zeros else 0
+            else:
+                bit = 0 if zeros <= ones else 1
 
-        filtered_values = tuple(value for value in values if len(value) >= index and value[index] == choosing_char)
-        return _recursive_search(filtered_values, keep_most, index + 1)
+            candidates = array.array('Q', (value for value in candidates if (value >> shift) & 1 == bit))
 
-    reports = tuple(strings)
-    oxygen_generator_rating = _recursive_search(values=reports, keep_most=True)
-    co2_scrubber_rating = _recursive_search(values=reports, keep_most=False)
+        return candidates[0]
 
-    return bin2dec(oxygen_generator_rating) * bin2dec(co2_scrubber_rating)
+    oxygen_generator_rating = _search(keep_most=True)
+    co2_scrubber_rating = _search(keep_most=False)
+
+    return oxygen_generator_rating * co2_scrubber_rating
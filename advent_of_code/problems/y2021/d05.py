@@ -82,15 +82,15 @@ Consider all of the lines. At how many points do at least two lines overlap?
 
 import typing
 from collections import Counter
-from dataclasses import dataclass
 from enum import IntEnum, unique
 from typing import Iterable, Tuple, Dict
+from advent_of_code.common import record
 
 
 Grid = Dict[Tuple[int, int], int]
 
 
-@dataclass(frozen=True)
+@record
 class Point:
     """ Координаты точки """
     x: int
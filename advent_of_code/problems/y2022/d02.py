@@ -41,9 +41,9 @@ This strategy guide predicts and recommends the following:
   What would your total score be if everything goes exactly according to your strategy guide?
 """
 
-from dataclasses import dataclass
 from enum import Enum
 from typing import Iterable
+from advent_of_code.common import record
 
 
 class OpponentChoice(Enum):
@@ -60,7 +60,7 @@ class MyChoice(Enum):
     scissors = 'Z'
 
 
-@dataclass(frozen=True)
+@record
 class Round:
     my: MyChoice
     opponent: OpponentChoice
@@ -0,0 +1,98 @@
+""" Запуск решений задач по году, дню и номеру задачи """
+
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple
+from advent_of_code.common import Task
+
+
+# Ключ решения: год, день, номер задачи
+SolutionKey = Tuple[int, int, Task]
+
+# Дополнительные аргументы решений, которым недостаточно входного набора данных
+EXTRA_ARGS: Mapping[SolutionKey, Tuple[Any, ...]] = {
+    (2015, 7, Task.first): ('a',),
+    (2015, 7, Task.second): ('a', 'b'),
+}
+
+
+def module_name(year: int, day: int) -> str:
+    """ Возвращает полное имя модуля с решением задач указанного дня """
+    return f'advent_of_code.problems.y{year}.d{day:02d}'
+
+
+def load_module(year: int, day: int) -> ModuleType:
+    """ Возвращает модуль с решением задач указанного дня """
+    return importlib.import_module(module_name(year, day))
+
+
+def solver(module: ModuleType, task: Task) -> Callable[..., Any]:
+    """ Возвращает функцию решения задачи из модуля """
+    func: Callable[..., Any] = getattr(module, f'{task.name}_task')
+    return func
+
+
+def solve(year: int, day: int, task: Task, strings: Iterable[str]) -> Any:
+    """ Возвращает ответ на задачу для указанного входного набора данных """
+    func = solver(load_module(year, day), task)
+    return func(strings, *EXTRA_ARGS.get((year, day, task), ()))
+
+
+# Решение задачи, загруженное в процессе-обработчике пула
+_worker_solver: Optional[Callable[[Iterable[str]], Any]] = None
+
+
+def _bind_solver(year: int, day: int, task: Task) -> Callable[[Iterable[str]], Any]:
+    """ Возвращает функцию решения с уже подставленными дополнительными аргументами """
+
+    func = solver(load_module(year, day), task)
+    extra_args = EXTRA_ARGS.get((year, day, task), ())
+
+    def bound(strings: Iterable[str]) -> Any:
+        return func(strings, *extra_args)
+
+    return bound
+
+
+def _init_worker(year: int, day: int, task: Task) -> None:
+    """ Однократная подготовка процесса-обработчика: импорт модуля и поиск решения """
+    global _worker_solver  # pylint: disable=global-statement
+    _worker_solver = _bind_solver(year, day, task)
+
+
+def _solve_in_worker(strings: Iterable[str]) -> Any:
+    """ Решение задачи в процессе-обработчике """
+    assert _worker_solver is not None
+    return _worker_solver(strings)
+
+
+def solve_many(
+        year: int,
+        day: int,
+        task: Task,
+        inputs: Sequence[Iterable[str]],
+        max_workers: Optional[int] = None,
+        chunksize: int = 16,
+) -> List[Any]:
+    """ Возвращает ответы на задачу для набора входных данных в исходном порядке
+
+    Модуль решения импортируется один раз в каждом процессе пула, поэтому подготовка,
+    выполняемая при импорте (скомпилированные шаблоны, таблицы, кеши lru_cache),
+    переиспользуется всеми входными наборами, попавшими в этот процесс.
+
+    :param inputs:      Входные наборы данных (должны поддерживать pickle, например, списки строк)
+    :param max_workers: Количество процессов; 1 - решение в текущем процессе без пула
+    :param chunksize:   Количество входных наборов, передаваемых процессу за один раз
+    """
+
+    if max_workers == 1:
+        bound = _bind_solver(year, day, task)
+        return [bound(strings) for strings in inputs]
+
+    with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(year, day, task),
+    ) as executor:
+        return list(executor.map(_solve_in_worker, inputs, chunksize=chunksize))
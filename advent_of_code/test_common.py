@@ -0,0 +1,131 @@
+""" Вспомогательные утилиты """
+
+import pickle
+import pytest
+from advent_of_code.common import ParseSpec, record
+
+
+@record
+class Point:
+    """ Точка на плоскости """
+    x: int
+    y: int
+    z: int = 0
+
+    @property
+    def distance(self) -> int:
+        """ Возвращает манхэттенское расстояние до начала координат """
+        return abs(self.x) + abs(self.y) + abs(self.z)
+
+
+class TestRecord:
+    """ Набор тестов для компактных записей """
+
+    def test_construction(self):
+        assert Point(1, 2) == Point(x=1, y=2, z=0)
+        assert Point(1, 2).distance == 3
+        assert repr(Point(1, -2)) == 'Point(x=1, y=-2, z=0)'
+
+    def test_no_instance_dict(self):
+        assert not hasattr(Point(1, 2), '__dict__')
+
+    def test_immutable(self):
+        point = Point(1, 2)
+        with pytest.raises(AttributeError):
+            point.x = 5
+        with pytest.raises(AttributeError):
+            del point.y
+
+    def test_hash(self):
+        point = Point(1, 2)
+        assert hash(point) == hash(point) == hash(Point(1, 2))
+        assert len({Point(1, 2), Point(1, 2), Point(2, 1)}) == 2
+        assert hash(Point(1, 2)) == hash((1, 2, 0))
+
+    def test_equality_requires_same_type(self):
+        @record
+        class Other:
+            x: int
+            y: int
+            z: int = 0
+
+        assert Point(1, 2) != Other(1, 2)
+
+    def test_pickle(self):
+        assert pickle.loads(pickle.dumps(Point(3, 4, 5))) == Point(3, 4, 5)
+
+    def test_subclass_requires_slots(self):
+        with pytest.raises(TypeError):
+            class Unslotted(Point):  # pylint: disable=unused-variable
+                """ Подкласс без __slots__ """
+
+        class Slotted(Point):
+            """ Подкласс с пустыми __slots__ """
+
+            __slots__ = ()
+
+        assert not hasattr(Slotted(1, 2), '__dict__')
+        assert Slotted(1, 2).distance == 3
+
+
+class TestParseSpec:
+    """ Набор тестов для декларативного разбора строк """
+
+    SPEC = ParseSpec(
+        (('NOT',), r'NOT (\w+) -> (\w+)', lambda operand, wire: ('NOT', operand, wire)),
+        (
+            ('AND', 'OR'),
+            r'(\w+) (AND|OR) (\w+) -> (\w+)',
+            lambda first, operation, second, wire: (operation, first, second, wire),
+        ),
+        (('->',), r'(\w+) -> (\w+)', lambda operand, wire: ('ASSIGN', operand, wire)),
+        error='Wrong command',
+    )
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        [
+            ('NOT x -> h\n', ('NOT', 'x', 'h')),
+            ('x AND y -> d', ('AND', 'x', 'y', 'd')),
+            ('123 -> x\n', ('ASSIGN', '123', 'x')),
+        ]
+    )
+    def test_parse(self, value, expected):
+        assert self.SPEC.parse(value) == expected
+
+    @pytest.mark.parametrize('value', ['x XOR y -> z', 'x AND y', '', 'NOT -> x'])
+    def test_parse_wrong_line(self, value):
+        with pytest.raises(ValueError, match='Wrong command'):
+            self.SPEC.parse(value)
+
+    def test_duplicate_token(self):
+        with pytest.raises(ValueError):
+            ParseSpec((('x',), r'(\w+)', str), (('x',), r'x (\w+)', str))
+
+    @pytest.mark.parametrize(
+        'buffer',
+        [
+            'NOT x -> h\nx OR y -> e\n456 -> y\n',
+            '\nNOT x -> h\r\n\nx OR y -> e  \n456 -> y',
+            'NOT x -> h\nx OR y -> e\n456 -> y\n\n',
+        ],
+    )
+    def test_parse_all(self, buffer):
+        assert list(self.SPEC.parse_all(buffer)) == [
+            ('NOT', 'x', 'h'),
+            ('OR', 'x', 'y', 'e'),
+            ('ASSIGN', '456', 'y'),
+        ]
+
+    @pytest.mark.parametrize(
+        'buffer, line',
+        [
+            ('NOT x -> h\nx XOR y -> e\n', 'x XOR y -> e'),
+            ('x XOR y -> e\nNOT x -> h\n', 'x XOR y -> e'),
+            ('NOT x -> h\nx AND y -> e extra\n456 -> y', 'x AND y -> e extra'),
+            ('NOT x -> h\n456 -> y\nx AND', 'x AND'),
+        ],
+    )
+    def test_parse_all_wrong_line(self, buffer, line):
+        with pytest.raises(ValueError, match=f'Wrong command: {line}$'):
+            list(self.SPEC.parse_all(buffer))
@@ -0,0 +1,68 @@
+""" Эмпирическая оценка сложности решений """
+
+import math
+import pytest
+from advent_of_code import complexity
+from advent_of_code.common import Task
+from advent_of_code.complexity import Case, Measurement, fit_exponent, geometric_sizes, measure, report
+
+
+def _quadratic_case() -> Case:
+    return Case(2021, 7, Task.first, lambda rnd, size: [','.join(str(rnd.randrange(size)) for _ in range(size))])
+
+
+class TestComplexity:
+    """ Набор тестов для оценки сложности """
+
+    @pytest.mark.parametrize('power', [1, 2, 3])
+    def test_fit_exponent(self, power):
+        points = [(size, 1e-9 * size ** power) for size in (10, 100, 1000)]
+        assert fit_exponent(points) == pytest.approx(power)
+
+    def test_fit_exponent_same_sizes(self):
+        assert math.isnan(fit_exponent([(100, 0.1), (100, 0.2)]))
+
+    def test_measure_imports_module_before_timing(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(complexity, 'load_module', lambda year, day: calls.append(('load', year, day)))
+        monkeypatch.setattr(complexity, 'solve', lambda year, day, task, strings: calls.append(('solve', year, day)))
+        measure(_quadratic_case(), [10, 20])
+        assert calls == [('load', 2021, 7), ('solve', 2021, 7), ('solve', 2021, 7)]
+
+    def test_geometric_sizes(self):
+        assert geometric_sizes(3, 5) == [1000, 10000, 100000]
+
+    def test_measure_stops_after_budget(self):
+        result = measure(_quadratic_case(), [10, 20, 40], budget=0.0)
+        assert [size for size, _ in result.points] == [10]
+
+    def test_superlinear_flag(self):
+        case = _quadratic_case()
+        measurement = Measurement(case=case, points=((100, 0.01), (1000, 1.0)))
+        assert measurement.superlinear
+        assert 'SUPERLINEAR' in report([measurement])
+
+    def test_report_puts_undefined_exponents_last(self):
+        case = _quadratic_case()
+        measurements = [
+            Measurement(case=case, points=((100, 0.01),)),
+            Measurement(case=case, points=((100, 0.01), (1000, 0.1))),
+            Measurement(case=case, points=((100, 0.01), (100, 0.02))),
+            Measurement(case=case, points=((100, 0.01), (1000, 1.0))),
+        ]
+        exponents = [line.split()[1] for line in report(measurements).splitlines()]
+        assert exponents == ['n^2.00', 'n^1.00', 'n^nan', 'n^nan']
+
+    def test_measure_custom_invoke(self):
+        calls = []
+        case = Case(
+            2021, 6, Task.first,
+            generate=lambda rnd, size: ['3,4,3,1,2'],
+            invoke=lambda func, strings: calls.append(func(18, strings)),
+        )
+        measure(case, [10])
+        assert calls == [26]
+
+    @pytest.mark.parametrize('case', complexity.CASES, ids=lambda case: case.name)
+    def test_cases_run(self, case):
+        assert len(measure(case, [20]).points) == 1
@@ -0,0 +1,55 @@
+""" Построчный подсчет исполнения кода через sys.monitoring """
+
+import sys
+import pytest
+from advent_of_code.hotlines import _code_objects, profile
+from advent_of_code.common import Task
+from advent_of_code.problems.y2015 import d06
+from advent_of_code.problems.y2017 import d05
+from advent_of_code.problems.y2021 import d02, d07
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='sys.monitoring requires Python 3.12+')
+class TestHotLines:
+    """ Набор тестов для инструментирования модуля решения """
+
+    def test_result_is_preserved(self):
+        result, _ = profile(d05, d05.first_task, ['0', '3', '0', '1', '-3'])
+        assert result == 5
+
+    def test_lines_and_branches_are_counted(self):
+        _, report = profile(d05, d05.first_task, ['0', '3', '0', '1', '-3'])
+        _, count = report.hottest(1)[0]
+        assert count >= 5
+        assert sum(stats.total for stats in report.branches.values()) > 0
+
+    def test_decorated_functions_are_counted(self):
+        d07._sum_of_first_nums.cache_clear()  # pylint: disable=protected-access
+        _, report = profile(d07, d07.second_task, ['16,1,2,0,4,2,7,1,2,14'])
+        code = d07._sum_of_first_nums.__wrapped__.__code__  # pylint: disable=protected-access
+        assert any(report.lines.get(line, 0) for _, _, line in code.co_lines() if line is not None)
+
+    def test_container_lambdas_are_counted(self):
+        _, report = profile(d06, d06.first_task, ['turn on 0,0 through 9,9', 'toggle 0,0 through 4,4'])
+        code = d06.SLICE_RULES[Task.first][d06.Action.toggle].__code__
+        assert report.lines.get(code.co_firstlineno, 0) > 0
+
+
+def test_decorated_code_objects_are_discovered():
+    codes = set(_code_objects(d07))
+    assert d07._sum_of_first_nums.__wrapped__.__code__ in codes  # pylint: disable=protected-access
+
+
+def test_container_lambdas_are_discovered():
+    codes = set(_code_objects(d06)) | set(_code_objects(d02))
+    assert all(rule.__code__ in codes for rules in d06.SLICE_RULES.values() for rule in rules.values())
+    builders = [builder for _, builder in d02.COMMAND_SPEC._rules.values()]  # pylint: disable=protected-access
+    assert all(builder.__code__ in codes for builder in builders)
+
+
+def test_requires_python_312():
+    if sys.version_info >= (3, 12):
+        pytest.skip('sys.monitoring is available')
+
+    with pytest.raises(RuntimeError):
+        profile(d05, d05.first_task, ['0'])
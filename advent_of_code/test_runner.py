@@ -0,0 +1,22 @@
+""" Запуск решений задач по году, дню и номеру задачи """
+
+from advent_of_code.common import Task
+from advent_of_code.runner import solve, solve_many
+
+
+class TestRunner:
+    """ Набор тестов для запуска решений """
+
+    def test_solve(self):
+        assert solve(2015, 1, Task.first, ['(()(()(']) == 3
+
+    def test_solve_with_extra_args(self):
+        assert solve(2015, 7, Task.first, ['123 -> x', 'x AND x -> a']) == 123
+
+    def test_solve_many_keeps_order(self):
+        inputs = [['(' * size] for size in range(50)]
+        assert solve_many(2015, 1, Task.first, inputs, max_workers=2, chunksize=4) == list(range(50))
+
+    def test_solve_many_in_process(self):
+        inputs = [['1,2,3'], ['16,1,2,0,4,2,7,1,2,14']]
+        assert solve_many(2021, 7, Task.second, inputs, max_workers=1) == [2, 168]
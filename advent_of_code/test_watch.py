@@ -0,0 +1,121 @@
+""" Инкрементальный перезапуск решений """
+
+import os
+import pytest
+from advent_of_code import watch
+from advent_of_code.common import BASE_DIR, Task
+from advent_of_code.watch import Fingerprint, Watcher
+
+
+def _pretend_changed(monkeypatch, *paths):
+    """ Подменяет отпечаток указанных файлов так, будто их содержимое изменилось """
+
+    fingerprint = watch._fingerprint
+
+    def changed(path, previous=None):
+        if path in paths:
+            return Fingerprint(mtime_ns=0, size=0, digest='changed')
+        return fingerprint(path, previous)
+
+    monkeypatch.setattr(watch, '_fingerprint', changed)
+
+
+def _record_reloads(monkeypatch, fail=()):
+    """ Заменяет перезагрузку модулей записью их имен (и ошибкой для модулей из fail) """
+
+    reloaded = []
+
+    def reload(module):
+        reloaded.append(module.__name__)
+        if module.__name__ in fail:
+            raise SyntaxError('invalid syntax')
+        return module
+
+    monkeypatch.setattr(watch.importlib, 'reload', reload)
+    return reloaded
+
+
+@pytest.fixture()
+def data_dir(tmp_path):
+    """ Каталог с входными данными для 1-ого дня 2015 года """
+    year_dir = tmp_path / 'y2015'
+    year_dir.mkdir()
+    (year_dir / 'd01.1').write_text('(((', encoding='utf-8')
+    (year_dir / 'd01.2').write_text('()())', encoding='utf-8')
+    return tmp_path
+
+
+class TestWatcher:
+    """ Набор тестов для отслеживания изменений входных данных """
+
+    def test_first_run_solves_everything(self, data_dir):
+        answers = Watcher(data_dir).run()
+        assert {key: answer.value for key, answer in answers.items()} == {
+            (2015, 1, Task.first): 3,
+            (2015, 1, Task.second): 5,
+        }
+
+    def test_unchanged_files_are_not_resolved(self, data_dir):
+        watcher = Watcher(data_dir)
+        watcher.run()
+        assert watcher.run() == {}
+
+    def test_touch_without_content_change_is_ignored(self, data_dir):
+        watcher = Watcher(data_dir)
+        watcher.run()
+        path = data_dir / 'y2015' / 'd01.1'
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert watcher.run() == {}
+
+    def test_only_changed_task_is_resolved(self, data_dir):
+        watcher = Watcher(data_dir)
+        watcher.run()
+        (data_dir / 'y2015' / 'd01.1').write_text(')))))', encoding='utf-8')
+        answers = watcher.run()
+        assert list(answers) == [(2015, 1, Task.first)]
+        assert answers[(2015, 1, Task.first)].value == -5
+        assert watcher.answers[(2015, 1, Task.second)].value == 5
+
+    def test_solver_error_is_reported(self, data_dir):
+        (data_dir / 'y2015' / 'd02.1').write_text('2x3\n', encoding='utf-8')
+        answer = Watcher(data_dir).run()[(2015, 2, Task.first)]
+        assert answer.value is None
+        assert answer.error
+
+    def test_reload_error_is_reported(self, data_dir, monkeypatch):
+        watcher = Watcher(data_dir)
+        watcher.run()
+
+        source = BASE_DIR / 'problems' / 'y2015' / 'd01.py'
+        _pretend_changed(monkeypatch, source)
+        _record_reloads(monkeypatch, fail={'advent_of_code.problems.y2015.d01'})
+        answers = watcher.run()
+        assert set(answers) == {(2015, 1, Task.first), (2015, 1, Task.second)}
+        assert all('SyntaxError' in (answer.error or '') for answer in answers.values())
+
+        # Пока модуль не изменился, задачи не перезапускаются, а ошибка сохраняется
+        assert watcher.run() == {}
+        assert watcher.answers[(2015, 1, Task.first)].error
+
+    def test_dependency_change_resolves_dependent_tasks(self, data_dir, monkeypatch):
+        (data_dir / 'y2015' / 'd02.1').write_text('2x3x4\n', encoding='utf-8')
+        watcher = Watcher(data_dir)
+        watcher.run()
+
+        _pretend_changed(monkeypatch, BASE_DIR / 'common.py')
+        reloaded = _record_reloads(monkeypatch)
+        answers = watcher.run()
+        assert list(answers) == [(2015, 2, Task.first)]
+        assert answers[(2015, 2, Task.first)].value == 58
+        assert reloaded == ['advent_of_code.common', 'advent_of_code.problems.y2015.d02']
+
+    def test_dependency_reload_error_is_reported(self, data_dir, monkeypatch):
+        (data_dir / 'y2015' / 'd02.1').write_text('2x3x4\n', encoding='utf-8')
+        watcher = Watcher(data_dir)
+        watcher.run()
+
+        _pretend_changed(monkeypatch, BASE_DIR / 'common.py')
+        _record_reloads(monkeypatch, fail={'advent_of_code.common'})
+        answers = watcher.run()
+        assert 'SyntaxError' in (answers[(2015, 2, Task.first)].error or '')
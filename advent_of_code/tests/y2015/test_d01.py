@@ -3,7 +3,15 @@
 from pathlib import Path
 import pytest
 from advent_of_code.common import Task
-from advent_of_code.problems.y2015.d01 import first_task, second_task
+from advent_of_code.problems.y2015 import d01
+from advent_of_code.problems.y2015.d01 import (
+    FloorIndex,
+    basement_position,
+    final_floor,
+    first_task,
+    parallel_basement_position,
+    second_task,
+)
 
 
 # Полный путь до каталога с тестовыми данными
@@ -36,6 +44,24 @@ class TestDay01:
     def test_first_task_from_file(self, y2015_file_loader):
         assert first_task(y2015_file_loader(self.DAY, Task.first)) == 74
 
+    @pytest.mark.parametrize(
+        'value, expected',
+        [
+            (b'', 0),
+            (b'(())', 0),
+            (b'(()(()(', 3),
+            (b'))(((((', 3),
+            (b')())())', -3),
+            (b'(()\n', 1),
+        ]
+    )
+    def test_final_floor(self, value, expected):
+        assert final_floor(value) == expected
+
+    def test_final_floor_from_file(self, y2015_file_loader):
+        buffer = ''.join(y2015_file_loader(self.DAY, Task.first)).encode()
+        assert final_floor(buffer) == 74
+
     @pytest.mark.parametrize(
         'value, expected',
         [
@@ -48,3 +74,95 @@ class TestDay01:
 
     def test_second_task_from_file(self, y2015_file_loader):
         assert second_task(y2015_file_loader(self.DAY, Task.second)) == 1795
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        [
+            (b'', 0),
+            (b'(((', 0),
+            (b')', 1),
+            (b'()())', 5),
+            (b'(\n))', 4),
+        ]
+    )
+    def test_basement_position(self, value, expected):
+        assert basement_position(value) == expected
+
+    def test_basement_position_across_blocks(self, monkeypatch):
+        monkeypatch.setattr(d01, 'BLOCK_SIZE', 4)
+        value = '((()' * 5 + ')' * 11
+        assert basement_position(value.encode()) == second_task([value]) == 31
+
+    def test_basement_position_from_file(self, y2015_file_loader):
+        buffer = ''.join(y2015_file_loader(self.DAY, Task.second)).encode()
+        assert basement_position(buffer) == 1795
+
+    @pytest.mark.parametrize(
+        'value',
+        [
+            '',
+            '(((',
+            ')',
+            '((()' * 5 + ')' * 11,
+            '(' * 40 + ')' * 39 + '()' * 10 + '))',
+            '()' * 30,
+        ]
+    )
+    def test_parallel_basement_position(self, value):
+        buffer = value.encode()
+        expected = basement_position(buffer)
+        assert parallel_basement_position(buffer, chunk_size=7, max_workers=2) == expected
+
+    def test_parallel_basement_position_from_file(self, y2015_file_loader):
+        buffer = ''.join(y2015_file_loader(self.DAY, Task.second)).encode()
+        assert parallel_basement_position(buffer, chunk_size=512, max_workers=2) == 1795
+
+    @pytest.mark.parametrize('value, expected', [('((()' * 5 + ')' * 11, 31), ('()' * 30, 0), (')', 1)])
+    def test_parallel_basement_position_mapped_file(self, tmp_path, value, expected):
+        path = tmp_path / 'd01.2'
+        path.write_bytes(value.encode())
+        assert parallel_basement_position(path, chunk_size=3, max_workers=2) == expected
+
+
+@pytest.mark.y2015d01
+class TestFloorIndex:
+    """ Набор тестов для индекса этажей """
+
+    INSTRUCTIONS = b'(()))(((\n)'
+    FLOORS = [0, 1, 2, 1, 0, -1, 0, 1, 2, 2, 1]
+
+    def test_floor_at(self):
+        index = FloorIndex(self.INSTRUCTIONS)
+        assert index.steps == len(self.FLOORS) - 1
+        assert [index.floor_at(step) for step in range(index.steps + 1)] == self.FLOORS
+
+    @pytest.mark.parametrize(
+        'floor, expected',
+        [
+            (0, 0),
+            (1, 1),
+            (2, 2),
+            (-1, 5),
+            (3, None),
+            (-2, None),
+        ]
+    )
+    def test_first_visit(self, floor, expected):
+        assert FloorIndex(self.INSTRUCTIONS).first_visit(floor) == expected
+
+    def test_range_min_max(self):
+        index = FloorIndex(self.INSTRUCTIONS)
+        for start in range(len(self.FLOORS)):
+            for stop in range(start + 1, len(self.FLOORS) + 1):
+                assert index.range_min(start, stop) == min(self.FLOORS[start:stop])
+                assert index.range_max(start, stop) == max(self.FLOORS[start:stop])
+
+    def test_empty_range(self):
+        with pytest.raises(ValueError):
+            FloorIndex(self.INSTRUCTIONS).range_min(3, 3)
+
+    def test_basement_from_file(self, y2015_file_loader):
+        buffer = ''.join(y2015_file_loader(1, Task.second)).encode()
+        index = FloorIndex(buffer)
+        assert index.first_visit(-1) == 1795
+        assert index.floor_at(index.steps) == 74
@@ -4,7 +4,7 @@
 import pytest
 
 from advent_of_code.common import Task
-from advent_of_code.problems.y2015.d02 import first_task, second_task
+from advent_of_code.problems.y2015.d02 import box_totals, first_task, second_task
 
 
 
@@ -39,3 +39,39 @@ class TestDay02:
 
     def test_second_task_from_file(self, y2015_file_loader):
         assert second_task(y2015_file_loader(self.DAY, Task.second)) == 3737498
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        [
+            (b'', (0, 0)),
+            (b'2x3x4', (58, 34)),
+            (b'1x1x10\n', (43, 14)),
+            (b'2x3x4\n1x1x10\n', (101, 48)),
+            (b'2x3x4\r\n1x1x10\r\n\n', (101, 48)),
+            (b'100x20x3\n', (4780, 6046)),
+        ]
+    )
+    def test_box_totals(self, value, expected):
+        assert box_totals(value) == expected
+
+    @pytest.mark.parametrize(
+        'value',
+        [
+            b'2x3\n',
+            b'2x3x4x1x1x10\n',
+            b'2x3\n4x1x1\n10\n',
+            b'2x3x4\n1x1x10 garbage\n',
+            b'2x3x4\n\n1x1x10\n',
+            b'2 3 4\n',
+            b'x2x3\n',
+            b'2x3x\n',
+            b'2xx3\n',
+        ]
+    )
+    def test_box_totals_wrong_input(self, value):
+        with pytest.raises(ValueError):
+            box_totals(value)
+
+    def test_box_totals_from_file(self, y2015_file_loader):
+        buffer = ''.join(y2015_file_loader(self.DAY, Task.first)).encode()
+        assert box_totals(buffer) == (1586300, 3737498)
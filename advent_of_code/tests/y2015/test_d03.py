@@ -2,7 +2,13 @@
 
 import pytest
 from advent_of_code.common import Task
-from advent_of_code.problems.y2015.d03 import first_task, second_task
+from advent_of_code.problems.y2015.d03 import (
+    count_fleet_houses,
+    count_houses,
+    count_houses_with_robot,
+    first_task,
+    second_task,
+)
 
 
 @pytest.mark.y2015d03
@@ -25,6 +31,23 @@ class TestDay03:
     def test_first_task_from_file(self, y2015_file_loader):
         assert first_task(y2015_file_loader(self.DAY, Task.first)) == 2572
 
+    @pytest.mark.parametrize(
+        'value, expected',
+        [
+            (b'', 1),
+            (b'>', 2),
+            (b'^>v<', 4),
+            (b'^v^v^v^v^v', 2),
+            (b'<<<<' * 3 + b'vvv', 16),
+        ]
+    )
+    def test_count_houses(self, value, expected):
+        assert count_houses(value) == expected
+
+    def test_count_houses_from_file(self, y2015_file_loader):
+        buffer = ''.join(y2015_file_loader(self.DAY, Task.first)).encode()
+        assert count_houses(buffer) == 2572
+
     @pytest.mark.parametrize(
         'value, expected',
         [
@@ -38,3 +61,39 @@ class TestDay03:
 
     def test_second_task_from_file(self, y2015_file_loader):
         assert second_task(y2015_file_loader(self.DAY, Task.second)) == 2631
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        [
+            (b'^v', 3),
+            (b'^>v<', 3),
+            (b'^v^v^v^v^v', 11),
+        ]
+    )
+    def test_count_houses_with_robot(self, value, expected):
+        assert count_houses_with_robot(value) == expected
+
+    def test_count_houses_with_robot_from_file(self, y2015_file_loader):
+        buffer = ''.join(y2015_file_loader(self.DAY, Task.second)).encode()
+        assert count_houses_with_robot(buffer) == 2631
+
+    @pytest.mark.parametrize('couriers', [1, 2, 3, 5, 64])
+    def test_count_fleet_houses(self, couriers):
+        directions = '^>v<<^^>vv>>^<v' * 9
+        moves = {'^': (0, 1), '>': (1, 0), 'v': (0, -1), '<': (-1, 0)}
+        positions, houses = [(0, 0)] * couriers, {(0, 0)}
+        for index, direction in enumerate(directions):
+            x, y = positions[index % couriers]
+            dx, dy = moves[direction]
+            positions[index % couriers] = (x + dx, y + dy)
+            houses.add((x + dx, y + dy))
+
+        assert count_fleet_houses(directions.encode(), couriers, max_workers=1) == len(houses)
+
+    def test_count_fleet_houses_in_pool(self, y2015_file_loader):
+        buffer = ''.join(y2015_file_loader(self.DAY, Task.second)).encode()
+        assert count_fleet_houses(buffer, couriers=2, max_workers=2) == 2631
+
+    def test_count_fleet_houses_wrong_couriers(self):
+        with pytest.raises(ValueError):
+            count_fleet_houses(b'^v', couriers=0)
@@ -1,7 +1,25 @@
 """ Day 4: The Ideal Stocking Stuffer """
 
+import hashlib
+import itertools
+import json
 import pytest
-from advent_of_code.problems.y2015.d04 import first_task, second_task
+from advent_of_code.problems.y2015.d04 import (
+    CheckpointedMiner,
+    first_nonces,
+    first_task,
+    leading_zero_bits,
+    parallel_mine,
+    second_task,
+)
+
+
+def _first_with_zero_bits(secret, bits):
+    return next(
+        num
+        for num in itertools.count()
+        if leading_zero_bits(hashlib.md5(f'{secret}{num}'.encode()).digest()) >= bits
+    )
 
 
 @pytest.mark.y2015d04
@@ -14,6 +32,7 @@ class TestDay04:
         'value, expected',
         [
             ('ckczppom', 117946),
+            ('abcdef', 609043),
         ]
     )
     def test_first_task_oneliners(self, value, expected):
@@ -28,3 +47,77 @@ class TestDay04:
     )
     def test_second_task_oneliners(self, value, expected):
         assert second_task(value) == expected
+
+    @pytest.mark.parametrize(
+        'secret, zeros, block_size',
+        [
+            ('abcdef', 3, 1000),
+            ('ckczppom', 4, 97),
+            ('pqrstuv', 2, 1),
+        ]
+    )
+    def test_parallel_mine_matches_sequential(self, secret, zeros, block_size):
+        expected = next(
+            num
+            for num in itertools.count()
+            if hashlib.md5(f'{secret}{num}'.encode()).hexdigest().startswith('0' * zeros)
+        )
+        assert parallel_mine(secret, zeros, block_size=block_size, max_workers=2) == expected
+
+    def test_parallel_mine(self):
+        assert parallel_mine('ckczppom', 5, block_size=20_000, max_workers=2) == 117946
+
+    @pytest.mark.parametrize(
+        'digest, expected',
+        [
+            (bytes(16), 128),
+            (b'\x00\x00\x01' + bytes(13), 23),
+            (b'\x00\x00\x0f' + bytes(13), 20),
+            (b'\x80' + bytes(15), 0),
+        ]
+    )
+    def test_leading_zero_bits(self, digest, expected):
+        assert leading_zero_bits(digest) == expected
+
+    @pytest.mark.parametrize(
+        'secret, levels',
+        [
+            ('abcdef', (4, 8, 12, 13)),
+            ('ckczppom', (16, 2, 9)),
+            ('pqrstuv', (6, 6)),
+        ]
+    )
+    def test_first_nonces(self, secret, levels):
+        assert first_nonces(secret, levels) == {bits: _first_with_zero_bits(secret, bits) for bits in levels}
+
+    def test_first_nonces_without_levels(self):
+        assert not first_nonces('abcdef', ())
+
+    @pytest.mark.parametrize('levels', [(20, 200), (0, 8), (8, 129), (-4,)])
+    def test_first_nonces_wrong_levels(self, levels):
+        with pytest.raises(ValueError):
+            first_nonces('abcdef', levels)
+
+    def test_checkpointed_search(self, tmp_path):
+        path = tmp_path / 'd04.json'
+        miner = CheckpointedMiner(path, index_bits=8, interval=500)
+        assert miner.search('abcdef', 14) == _first_with_zero_bits('abcdef', 14)
+
+        # Поиск меньшей сложности отвечается по индексу, сохраненному предыдущим запуском
+        miner = CheckpointedMiner(path, index_bits=8, interval=500)
+        assert miner.lookup('abcdef', 10) == _first_with_zero_bits('abcdef', 10)
+        assert miner.lookup('abcdef', 16) is None
+        assert miner.lookup('pqrstuv', 10) is None
+
+    def test_checkpointed_search_resumes(self, tmp_path):
+        path = tmp_path / 'd04.json'
+        expected = _first_with_zero_bits('abcdef', 12)
+
+        # Числа до сохраненной границы повторно не проверяются, поэтому найденное число пропускается
+        path.write_text(json.dumps({'8': {'abcdef': {'scanned': expected + 1, 'hits': {}}}}), encoding='utf-8')
+        miner = CheckpointedMiner(path, index_bits=8, interval=500)
+        assert miner.search('abcdef', 12) > expected
+
+        path.write_text(json.dumps({'8': {'abcdef': {'scanned': expected, 'hits': {}}}}), encoding='utf-8')
+        assert miner.search('abcdef', 12) == expected
+        assert miner.search('abcdef', 4) == _first_with_zero_bits('abcdef', 4)
@@ -1,8 +1,10 @@
 """ Day 5: Doesn't He Have Intern-Elves For This? """
 
+import random
+import re
 import pytest
 from advent_of_code.common import Task
-from advent_of_code.problems.y2015.d05 import first_task, second_task
+from advent_of_code.problems.y2015.d05 import count_nice, first_task, has_repeated_pair, second_task
 
 
 @pytest.mark.y2015d05
@@ -40,3 +42,43 @@ class TestDay05:
 
     def test_second_task_from_file(self, y2015_file_loader):
         assert second_task(y2015_file_loader(self.DAY, Task.second)) == 55
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        [
+            (b'ugknbfddgicrmopn\naaa\njchzalrnumimnmhp\nhaegwjzuvuyypxyu\ndvszwmarrgswjxmb\n', (2, 0)),
+            (b'qjhvhtzxzqqjkmpb\nxxyxx\nuurcxstgmygtbstg\nieodomkazucvgmuy', (0, 2)),
+            (b'aaaa\r\naaa\r\n\r\n', (2, 1)),
+            (b'', (0, 0)),
+        ]
+    )
+    def test_count_nice(self, value, expected):
+        assert count_nice(value) == expected
+
+    def test_count_nice_from_file(self, y2015_file_loader):
+        buffer = ''.join(y2015_file_loader(self.DAY, Task.first)).encode()
+        assert count_nice(buffer) == (255, 55)
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        [
+            ('xyxy', True),
+            ('aabcdefgaa', True),
+            ('aaa', False),
+            ('aaaa', True),
+            ('ab-ab', True),
+            ('ab', False),
+            ('', False),
+            ('ab' + '-' * 10 ** 6 + 'ab', True),
+            ('aaa' + '-' * 10 ** 6, False),
+        ]
+    )
+    def test_has_repeated_pair(self, value, expected):
+        assert has_repeated_pair(value) is expected
+
+    def test_has_repeated_pair_matches_regex(self):
+        rnd = random.Random(5)
+        for alphabet in ('ab', 'abc', 'ab-', 'abcdefghijklmnopqrstuvwxyz'):
+            for _ in range(2000):
+                string = ''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 12)))
+                assert has_repeated_pair(string) is (re.search(r'([a-z][a-z]).*\1', string) is not None), string
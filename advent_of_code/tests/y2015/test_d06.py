@@ -1,8 +1,41 @@
 """ Day 6: Probably a Fire Hazard """
 
+import random
+import numpy as np
 import pytest
 from advent_of_code.common import Task
-from advent_of_code.problems.y2015.d06 import first_task, second_task
+from advent_of_code.problems.y2015.d06 import (
+    CELL_RULES,
+    ENGINES,
+    Action,
+    Command,
+    Engine,
+    Garland,
+    Point,
+    Range,
+    SummedArea,
+    Totals,
+    _parse_input,
+    apply_commands,
+    first_task,
+    parallel_apply,
+    second_task,
+    summed_area,
+    timeline,
+)
+
+
+# Реализации, поддерживающие вторую задачу
+BRIGHTNESS_ENGINES = [engine for engine in Engine if engine is not Engine.bitset]
+
+
+def _random_commands(rnd, grid_size, count):
+    result = []
+    for _ in range(count):
+        left, right = sorted(rnd.randrange(grid_size) for _ in range(2))
+        top, bottom = sorted(rnd.randrange(grid_size) for _ in range(2))
+        result.append(Command(action=rnd.choice(list(Action)), range=Range(Point(left, top), Point(right, bottom))))
+    return result
 
 
 @pytest.mark.y2015d06
@@ -11,28 +44,148 @@ class TestDay06:
 
     DAY = 6
 
+    @pytest.mark.parametrize('engine', list(Engine))
     @pytest.mark.parametrize(
         'value, expected',
         [
             (['turn on 0,0 through 999,999', 'toggle 0,0 through 999,0', 'turn off 499,499 through 500,500'], 998996),
         ],
     )
-    def test_first_task_oneliners(self, value, expected):
-        assert first_task(value) == expected
+    def test_first_task_oneliners(self, value, expected, engine):
+        assert first_task(value, engine) == expected
 
-    @pytest.mark.skip
     def test_first_task_from_file(self, y2015_file_loader):
         assert first_task(y2015_file_loader(self.DAY, Task.first)) == 377891
 
+    @pytest.mark.parametrize('engine', BRIGHTNESS_ENGINES)
     @pytest.mark.parametrize(
         'value, expected',
         [
             (['turn on 0,0 through 0,0', 'toggle 0,0 through 999,999'], 2000001),
         ],
     )
-    def test_second_task_oneliners(self, value, expected):
-        assert second_task(value) == expected
+    def test_second_task_oneliners(self, value, expected, engine):
+        assert second_task(value, engine) == expected
 
-    @pytest.mark.skip
     def test_second_task_from_file(self, y2015_file_loader):
         assert second_task(y2015_file_loader(self.DAY, Task.second)) == 14110788
+
+    @pytest.mark.parametrize(
+        'task, engine',
+        [(Task.first, engine) for engine in Engine] + [(Task.second, engine) for engine in BRIGHTNESS_ENGINES],
+    )
+    def test_engines_agree(self, task, engine):
+        rnd = random.Random(6)
+        for _ in range(10):
+            commands = _random_commands(rnd, grid_size=40, count=20)
+            assert ENGINES[engine](commands, task, 40) == ENGINES[Engine.cells](commands, task, 40)
+
+    def test_bitset_engine_first_task_only(self):
+        with pytest.raises(ValueError):
+            second_task(['turn on 0,0 through 0,0'], Engine.bitset)
+
+    def test_bitset_engine_from_file(self, y2015_file_loader):
+        assert first_task(y2015_file_loader(self.DAY, Task.first), Engine.bitset) == 377891
+
+    @pytest.mark.parametrize('engine', [Engine.numpy, Engine.compressed, Engine.bitset, Engine.banded])
+    def test_first_task_large_grid(self, engine):
+        commands = ['turn on 0,0 through 1999,1999', 'toggle 0,0 through 1999,0', 'turn off 999,999 through 1000,1000']
+        assert first_task(commands, engine, grid_size=2000) == 2000 * 2000 - 2000 - 4
+
+    @pytest.mark.parametrize('engine', [Engine.numpy, Engine.compressed, Engine.banded])
+    def test_second_task_large_grid(self, engine):
+        commands = ['turn on 0,0 through 1999,1999', 'toggle 0,0 through 1999,0', 'turn off 999,999 through 1000,1000']
+        assert second_task(commands, engine, grid_size=2000) == 2000 * 2000 + 2 * 2000 - 4
+
+    @pytest.mark.parametrize(
+        'task, expected',
+        [
+            (Task.first, 10 ** 12 - 10 ** 6 - 4),
+            (Task.second, 10 ** 12 + 2 * 10 ** 6 - 4),
+        ]
+    )
+    def test_compressed_engine_huge_grid(self, task, expected):
+        size = 10 ** 6
+        commands = [
+            Command(action=Action.on, range=Range(Point(0, 0), Point(size - 1, size - 1))),
+            Command(action=Action.toggle, range=Range(Point(0, 0), Point(size - 1, 0))),
+            Command(action=Action.off, range=Range(Point(size // 2 - 1, size // 2 - 1), Point(size // 2, size // 2))),
+        ]
+        assert ENGINES[Engine.compressed](commands, task, size) == expected
+
+    @pytest.mark.parametrize(
+        'task, expected',
+        [
+            (Task.first, [Totals(lit=9, brightness=9), Totals(lit=17, brightness=17), Totals(lit=12, brightness=12)]),
+            (Task.second, [Totals(lit=9, brightness=9), Totals(lit=21, brightness=41), Totals(lit=16, brightness=32)]),
+        ]
+    )
+    def test_timeline(self, task, expected):
+        commands = ['turn on 0,0 through 2,2', 'toggle 1,1 through 4,4', 'turn off 0,0 through 2,2']
+        assert list(timeline(commands, task, grid_size=5)) == expected
+
+    @pytest.mark.parametrize('task', list(Task))
+    def test_timeline_matches_final_state(self, task):
+        commands = _random_commands(random.Random(48), grid_size=30, count=15)
+        garland, grid = Garland(30), Garland(30)
+        for command, totals in zip(commands, grid.timeline(commands, task)):
+            garland.apply(command, CELL_RULES[task])
+            assert totals == grid.totals()
+            lights = list(garland.iterate())
+            assert totals.brightness == sum(light.brightness for light in lights)
+            assert totals.lit == len([light for light in lights if light.brightness > 0])
+
+    def test_timeline_continues_from_current_state(self):
+        garland = Garland(5, def_brightness=1)
+        commands = list(_parse_input(['turn off 0,0 through 1,1', 'toggle 4,4 through 4,4']))
+        assert garland.totals() == Totals(lit=25, brightness=25)
+        assert list(garland.timeline(commands, Task.second)) == [
+            Totals(lit=21, brightness=21),
+            Totals(lit=21, brightness=23),
+        ]
+        assert garland.grid[4, 4] == 3
+
+    def test_summed_area(self):
+        rnd = random.Random(49)
+        commands = _random_commands(rnd, grid_size=30, count=20)
+        garland, grid = Garland(30), Garland(30)
+        for command in commands:
+            garland.apply(command, CELL_RULES[Task.second])
+            grid.update(command, Task.second)
+
+        table = grid.summed_area()
+        expected = SummedArea(apply_commands(commands, Task.second, 30))
+        assert np.array_equal(table.brightness_table, expected.brightness_table)
+        ranges = []
+        for command in _random_commands(rnd, grid_size=30, count=50):
+            lights = list(garland.iterate(command.range))
+            assert table.brightness(command.range) == sum(light.brightness for light in lights)
+            assert table.lit(command.range) == len([light for light in lights if light.brightness > 0])
+            top, bottom = command.range.top, command.range.bottom
+            ranges.append((top.x, top.y, bottom.x, bottom.y))
+
+        brightness, lit = table.query(np.array(ranges))
+        assert brightness.tolist() == [table.brightness(Range(Point(*r[:2]), Point(*r[2:]))) for r in ranges]
+        assert lit.tolist() == [table.lit(Range(Point(*r[:2]), Point(*r[2:]))) for r in ranges]
+
+    def test_summed_area_from_input(self):
+        table = summed_area(['turn on 0,0 through 4,4', 'toggle 1,1 through 2,2'], Task.second, grid_size=5)
+        brightness, lit = table.query(np.array([[0, 0, 4, 4], [1, 1, 1, 1], [4, 0, 4, 4]]))
+        assert brightness.tolist() == [33, 3, 5]
+        assert lit.tolist() == [25, 1, 5]
+
+    @pytest.mark.parametrize(
+        'ranges',
+        [
+            [0, 0, 1, 1],
+            [[-1, 0, 4, 4]],
+            [[3, 3, 1, 1]],
+            [[0, 0, 5, 4]],
+            [[0, 0, 4, 5]],
+            [[0, 2, 4, 1]],
+        ]
+    )
+    def test_summed_area_wrong_ranges(self, ranges):
+        table = summed_area(['turn on 0,0 through 4,4'], Task.first, grid_size=5)
+        with pytest.raises(ValueError):
+            table.query(np.array(ranges))
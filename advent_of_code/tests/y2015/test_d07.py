@@ -2,7 +2,7 @@
 
 import pytest
 from advent_of_code.common import Task
-from advent_of_code.problems.y2015.d07 import first_task, second_task
+from advent_of_code.problems.y2015.d07 import _parse_input, first_task, second_task
 
 
 @pytest.mark.y2015d07
@@ -58,3 +58,10 @@ class TestDay07:
 
     def test_second_task_from_file(self, y2015_file_loader):
         assert second_task(y2015_file_loader(self.DAY, Task.second), 'a', 'b') == 40149
+
+    @pytest.mark.parametrize(
+        'value',
+        ['123 -> x', 'x AND y -> z', 'x OR y -> z', 'x LSHIFT 2 -> z', 'x RSHIFT 2 -> z', 'NOT x -> z'],
+    )
+    def test_commands_have_no_dict(self, value):
+        assert not hasattr(_parse_input(value), '__dict__')
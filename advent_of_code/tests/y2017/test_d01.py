@@ -1,5 +1,6 @@
 """ Day 01: Inverse Captcha """
 
+import itertools
 import pytest
 from advent_of_code.common import Task
 from advent_of_code.problems.y2017.d01 import first_task, second_task
@@ -41,3 +42,11 @@ class TestDay01:
 
     def test_second_task_from_file(self, y2017_file_loader):
         assert second_task(y2017_file_loader(self.DAY, Task.second)) == 1102
+
+    def test_first_task_bounded_memory(self, bounded_memory):
+        strings = itertools.repeat('1122', 25_000)
+        assert bounded_memory(first_task, strings, 16 * 1024) == 75_000
+
+    def test_second_task_bounded_memory(self, bounded_memory):
+        strings = itertools.repeat('1212', 25_000)
+        assert bounded_memory(second_task, strings, 256 * 1024) == 150_000
@@ -58,3 +58,7 @@ class TestDay03:
 
     def test_second_task_from_file(self, y2021_file_loader):
         assert second_task(y2021_file_loader(self.DAY, Task.second)) == 6124992
+
+    def test_second_task_bounded_memory(self, bounded_memory):
+        strings = (f'{value:018b}' for value in range(3, 60_000, 3))
+        assert bounded_memory(second_task, strings, 512 * 1024) == 1719399870
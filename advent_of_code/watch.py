@@ -0,0 +1,288 @@
+""" Инкрементальный перезапуск решений при изменении входных данных или исходного кода
+
+Файлы опрашиваются по времени модификации и размеру; при их изменении сравнивается
+хеш содержимого, поэтому простое обновление mtime не приводит к перезапуску.
+Заново решаются только те задачи, у которых изменились входные данные, модуль решения
+или модули пакета, которые он импортирует (например, common.py); для остальных используются
+полученные ранее ответы. Кешируются только прочитанные строки входных данных, а не результат
+их разбора: разбор выполняется решением при каждом перезапуске.
+
+Ошибка при перезагрузке модуля (например, синтаксическая) не прерывает опрос, а сохраняется
+как ответ на задачи этого дня.
+
+Пример запуска :
+
+    python -m advent_of_code.watch
+"""
+
+import ast
+import hashlib
+import importlib
+import re
+import sys
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from advent_of_code.common import Task, BASE_DIR, DATA_DIR
+from advent_of_code.runner import SolutionKey, module_name, solve
+
+
+# Шаблон имени файла с входными данными относительно каталога данных
+DATA_FILE_TEMPLATE = re.compile(r'y(\d{4})/d(\d{2})\.(\d)$')
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """ Отпечаток состояния файла """
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+@dataclass(frozen=True)
+class Answer:
+    """ Результат решения задачи """
+    value: Any = None
+    error: Optional[str] = None
+
+
+def _fingerprint(path: Path, previous: Optional[Fingerprint] = None) -> Fingerprint:
+    """ Возвращает отпечаток файла, вычисляя хеш содержимого только при изменении mtime или размера """
+
+    stat = path.stat()
+    if previous is not None and (previous.mtime_ns, previous.size) == (stat.st_mtime_ns, stat.st_size):
+        return previous
+
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    return Fingerprint(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=digest)
+
+
+def _module_path(name: str) -> Optional[Path]:
+    """ Возвращает файл модуля пакета по его полному имени (None для внешних модулей и имен внутри модуля) """
+
+    package, *parts = name.split('.')
+    if package != BASE_DIR.name:
+        return None
+
+    path = BASE_DIR.joinpath(*parts)
+    if path.with_suffix('.py').is_file():
+        return path.with_suffix('.py')
+    if (path / '__init__.py').is_file():
+        return path / '__init__.py'
+
+    return None
+
+
+def _path_module(path: Path) -> str:
+    """ Возвращает полное имя модуля пакета по его файлу """
+    parts = path.relative_to(BASE_DIR.parent).with_suffix('').parts
+    return '.'.join(parts[:-1] if parts[-1] == '__init__' else parts)
+
+
+def _imports(path: Path) -> Set[Path]:
+    """ Возвращает файлы модулей пакета, которые непосредственно импортирует модуль """
+
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except SyntaxError:
+        return set()
+
+    names: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+            names.extend(f'{node.module}.{alias.name}' for alias in node.names)
+
+    return {module for module in map(_module_path, names) if module is not None and module != path}
+
+
+class Watcher:
+    """ Отслеживание изменений входных данных и решений """
+
+    def __init__(self, data_dir: Path = DATA_DIR) -> None:
+        self.data_dir: Path = data_dir
+        self.answers: Dict[SolutionKey, Answer] = {}
+        self._files: Dict[Path, Fingerprint] = {}
+        self._lines: Dict[str, Tuple[str, ...]] = {}
+        self._data_files: Dict[SolutionKey, Path] = {}
+        self._imports: Dict[Path, Set[Path]] = {}
+        self._module_errors: Dict[Tuple[int, int], str] = {}
+
+    def _discover(self) -> Dict[SolutionKey, Path]:
+        """ Возвращает файлы с входными данными в разрезе задач """
+
+        result = {}
+        for path in self.data_dir.glob('y*/d*.*'):
+            if match := DATA_FILE_TEMPLATE.search(path.relative_to(self.data_dir).as_posix()):
+                year, day, task = (int(value) for value in match.groups())
+                if task in {item.value for item in Task}:
+                    result[(year, day, Task(task))] = path
+
+        return result
+
+    def _changed(self, path: Path) -> bool:
+        """ Обновляет отпечаток файла и возвращает True если содержимое файла изменилось """
+
+        previous = self._files.get(path)
+        current = _fingerprint(path, previous)
+        self._files[path] = current
+
+        return previous is None or previous.digest != current.digest
+
+    def _read(self, path: Path) -> Tuple[str, ...]:
+        """ Возвращает строки файла с входными данными (из кеша, если содержимое не менялось) """
+
+        digest = self._files[path].digest
+        if digest not in self._lines:
+            with open(path, 'r', encoding='utf-8') as file:
+                self._lines[digest] = tuple(file)
+
+        return self._lines[digest]
+
+    def poll(self) -> List[SolutionKey]:
+        """ Возвращает задачи, у которых изменились входные данные, модуль решения или его зависимости """
+
+        self._data_files = data_files = self._discover()
+
+        # Удаленные файлы больше не отслеживаются
+        for key in set(self.answers) - set(data_files):
+            del self.answers[key]
+
+        sources = {}
+        for year, day in {(year, day) for year, day, _ in data_files}:
+            source = BASE_DIR / 'problems' / f'y{year}' / f'd{day:02d}.py'
+            if source.exists():
+                sources[(year, day)] = source
+
+        changed_modules = self._reload_sources(sources)
+
+        result = []
+        for key, path in sorted(data_files.items(), key=lambda item: (item[0][0], item[0][1], item[0][2].value)):
+            year, day, _ = key
+            data_changed = self._changed(path)
+            if data_changed or (year, day) in changed_modules or key not in self.answers:
+                result.append(key)
+
+        live = {self._files[path].digest for path in data_files.values()}
+        self._lines = {digest: lines for digest, lines in self._lines.items() if digest in live}
+
+        return result
+
+    def _reload_sources(self, sources: Dict[Tuple[int, int], Path]) -> Set[Tuple[int, int]]:
+        """ Перезагружает изменившиеся модули решений и их зависимости, возвращает изменившиеся дни """
+
+        dependencies, changed, reloadable = self._scan_sources(sources.values())
+
+        # Сначала перезагружаются вспомогательные модули пакета, затем зависящие от них решения
+        helper_errors = {}
+        for path in sorted(reloadable - set(sources.values())):
+            if error := self._reload(_path_module(path)):
+                helper_errors[path] = error
+
+        result = set()
+        for (year, day), source in sources.items():
+            if not dependencies[source] & changed:
+                continue
+
+            result.add((year, day))
+            error = next((helper_errors[path] for path in sorted(dependencies[source]) if path in helper_errors), None)
+            if error is None and dependencies[source] & reloadable:
+                error = self._reload(module_name(year, day))
+            if error is None:
+                self._module_errors.pop((year, day), None)
+            else:
+                self._module_errors[(year, day)] = error
+
+        return result
+
+    def _scan_sources(self, sources: Iterable[Path]) -> Tuple[Dict[Path, Set[Path]], Set[Path], Set[Path]]:
+        """ Обходит модули решений и импортируемые ими модули пакета
+
+        :return:    Файлы, от которых зависит каждый модуль решения (включая его самого),
+                    изменившиеся файлы и изменившиеся файлы, которые отслеживались и ранее
+                    (только их модули нужно перезагрузить)
+        """
+
+        changed: Set[Path] = set()
+        reloadable: Set[Path] = set()
+        visited: Set[Path] = set()
+
+        def visit(path: Path) -> None:
+            if path in visited:
+                return
+            visited.add(path)
+
+            known = path in self._files
+            if self._changed(path) or path not in self._imports:
+                self._imports[path] = _imports(path)
+                changed.add(path)
+                if known:
+                    reloadable.add(path)
+
+            for module in self._imports[path]:
+                visit(module)
+
+        dependencies = {}
+        for source in sources:
+            visit(source)
+            closure, stack = {source}, [source]
+            while stack:
+                for module in self._imports[stack.pop()] - closure:
+                    closure.add(module)
+                    stack.append(module)
+            dependencies[source] = closure
+
+        return dependencies, changed, reloadable
+
+    @staticmethod
+    def _reload(name: str) -> Optional[str]:
+        """ Перезагружает уже импортированный модуль и возвращает описание ошибки, если она произошла """
+
+        if name not in sys.modules:
+            return None
+
+        try:
+            importlib.reload(sys.modules[name])
+        except Exception:  # pylint: disable=broad-except
+            return traceback.format_exc(limit=-1).strip()
+
+        return None
+
+    def run(self) -> Dict[SolutionKey, Answer]:
+        """ Перезапускает решения изменившихся задач и возвращает их ответы """
+
+        result = {}
+        for key in self.poll():
+            if error := self._module_errors.get(key[:2]):
+                self.answers[key] = result[key] = Answer(error=error)
+                continue
+
+            try:
+                answer = Answer(value=solve(*key, iter(self._read(self._data_files[key]))))
+            except Exception:  # pylint: disable=broad-except
+                answer = Answer(error=traceback.format_exc(limit=-1).strip())
+            self.answers[key] = result[key] = answer
+
+        return result
+
+
+def watch(
+        interval: float = 1.0,
+        data_dir: Path = DATA_DIR,
+        report: Callable[[SolutionKey, Answer], None] = print,
+) -> None:
+    """ Бесконечный цикл опроса файлов с перезапуском изменившихся решений """
+
+    watcher = Watcher(data_dir)
+    while True:
+        for key, answer in watcher.run().items():
+            report(key, answer)
+        time.sleep(interval)
+
+
+if __name__ == '__main__':
+    watch(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0)